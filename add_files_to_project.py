@@ -2,8 +2,7 @@
 """
 Script to add missing Swift files to the Xcode project.
 """
-import uuid
-import re
+import secrets
 
 # Files to add
 files_to_add = [
@@ -14,67 +13,82 @@ files_to_add = [
 ]
 
 def generate_uuid():
-    """Generate a UUID in Xcode format (8-4-4-4-12 hex digits, uppercase)"""
-    return uuid.uuid4().hex[:24].upper()
+    """Generate an object ID in Xcode format (24 uppercase hex digits)"""
+    return secrets.token_hex(12).upper()
 
-def add_files_to_pbxproj(project_path):
+def add_files_to_pbxproj(project_path, files):
+    """Add all (path, filename) pairs with one read, one splice and one write."""
     with open(project_path, 'r') as f:
         content = f.read()
-    
+
     # Generate UUIDs for each file
     file_refs = {}
     build_files = {}
-    
-    for path, filename in files_to_add:
+
+    for path, filename in files:
         file_ref_uuid = generate_uuid()
         build_file_uuid = generate_uuid()
         file_refs[filename] = (file_ref_uuid, path)
         build_files[filename] = (build_file_uuid, file_ref_uuid, filename)
-    
+
+    # Insertions are collected as (offset, text) against the original content
+    inserts = []
+
     # Find the PBXBuildFile section
-    build_file_section_match = re.search(r'(/\* Begin PBXBuildFile section \*/\n)', content)
-    if build_file_section_match:
-        insert_pos = build_file_section_match.end()
+    anchor = '/* Begin PBXBuildFile section */\n'
+    pos = content.find(anchor)
+    if pos != -1:
         # Add build file entries
         build_file_entries = []
         for filename, (build_uuid, ref_uuid, _) in build_files.items():
             entry = f"\t\t{build_uuid} /* {filename} in Sources */ = {{isa = PBXBuildFile; fileRef = {ref_uuid} /* {filename} */; }};\n"
             build_file_entries.append(entry)
-        
-        content = content[:insert_pos] + ''.join(build_file_entries) + content[insert_pos:]
-    
+
+        inserts.append((pos + len(anchor), ''.join(build_file_entries)))
+
     # Find the PBXFileReference section
-    file_ref_section_match = re.search(r'(/\* Begin PBXFileReference section \*/\n)', content)
-    if file_ref_section_match:
-        insert_pos = file_ref_section_match.end()
+    anchor = '/* Begin PBXFileReference section */\n'
+    pos = content.find(anchor)
+    if pos != -1:
         # Add file reference entries
         file_ref_entries = []
         for filename, (ref_uuid, path) in file_refs.items():
             entry = f"\t\t{ref_uuid} /* {filename} */ = {{isa = PBXFileReference; lastKnownFileType = sourcecode.swift; path = \"{path}\"; sourceTree = \"<group>\"; }};\n"
             file_ref_entries.append(entry)
-        
-        content = content[:insert_pos] + ''.join(file_ref_entries) + content[insert_pos:]
-    
+
+        inserts.append((pos + len(anchor), ''.join(file_ref_entries)))
+
     # Find the PBXSourcesBuildPhase section and add to files
-    sources_section_match = re.search(r'(/\* Sources \*/ = \{[^}]*files = \(\n)', content)
-    if sources_section_match:
-        insert_pos = sources_section_match.end()
+    # (its "files = (" list must open before the object's first closing brace)
+    phase_pos = content.find('/* Sources */ = {')
+    files_anchor = 'files = (\n'
+    files_pos = content.find(files_anchor, phase_pos) if phase_pos != -1 else -1
+    if files_pos != -1 and content.find('}', phase_pos, files_pos) == -1:
         # Add to build phase
         build_phase_entries = []
         for filename, (build_uuid, _, _) in build_files.items():
             entry = f"\t\t\t\t{build_uuid} /* {filename} in Sources */,\n"
             build_phase_entries.append(entry)
-        
-        content = content[:insert_pos] + ''.join(build_phase_entries) + content[insert_pos:]
-    
+
+        inserts.append((files_pos + len(files_anchor), ''.join(build_phase_entries)))
+
+    # Splice all insertions in one pass
+    parts = []
+    cursor = 0
+    for offset, text in sorted(inserts):
+        parts.append(content[cursor:offset])
+        parts.append(text)
+        cursor = offset
+    parts.append(content[cursor:])
+
     # Write back
     with open(project_path, 'w') as f:
-        f.write(content)
-    
-    print(f"✅ Added {len(files_to_add)} files to project")
-    for _, filename in files_to_add:
+        f.write(''.join(parts))
+
+    print(f"✅ Added {len(files)} files to project")
+    for _, filename in files:
         print(f"   - {filename}")
 
 if __name__ == "__main__":
     project_path = "/Users/euanspencer/Cosmo-Local-BCKP/CosmoOS/CosmoOS.xcodeproj/project.pbxproj"
-    add_files_to_pbxproj(project_path)
+    add_files_to_pbxproj(project_path, files_to_add)
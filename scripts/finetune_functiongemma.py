@@ -11,9 +11,13 @@ This script:
 Target: CosmoOS voice command dispatch with <300ms latency
 """
 
+import importlib.util
 import json
+import os
+import shutil
 import subprocess
 import sys
+from datetime import datetime
 from pathlib import Path
 
 
@@ -46,10 +50,27 @@ TRAIN_CONFIG = {
     "warmup_steps": 30,
     "save_every": 100,
     "val_batches": 25,
-    "grad_checkpoint": False,  # Not needed for 270M model
 }
 
 
+def count_lines(path: Path) -> int:
+    """Count newlines in a file using 1 MiB binary reads."""
+    count = 0
+    with open(path, "rb", buffering=0) as f:
+        while chunk := f.read(1 << 20):
+            count += chunk.count(b"\n")
+    return count
+
+
+def link_or_copy(src: Path, dst: Path):
+    """Hardlink src to dst, copying only if a link is not possible."""
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
 def prepare_training_data():
     """Prepare training data for FunctionGemma fine-tuning.
 
@@ -64,34 +85,25 @@ def prepare_training_data():
     valid_path = TRAINING_DATA_DIR / "valid_original.jsonl"
 
     # Count examples
-    train_count = sum(1 for _ in open(train_path))
-    valid_count = sum(1 for _ in open(valid_path))
+    train_count = count_lines(train_path)
+    valid_count = count_lines(valid_path)
 
     print(f"  Training examples: {train_count}")
     print(f"  Validation examples: {valid_count}")
     print(f"  Format: FunctionGemma native (developer/user/model roles)")
 
-    # Copy to expected names for mlx-lm
-    import shutil
-    shutil.copy(train_path, TRAINING_DATA_DIR / "train.jsonl")
-    shutil.copy(valid_path, TRAINING_DATA_DIR / "valid.jsonl")
+    # Link to expected names for mlx-lm
+    link_or_copy(train_path, TRAINING_DATA_DIR / "train.jsonl")
+    link_or_copy(valid_path, TRAINING_DATA_DIR / "valid.jsonl")
 
-    print(f"  Copied to train.jsonl and valid.jsonl")
+    print(f"  Linked to train.jsonl and valid.jsonl")
 
     return TRAINING_DATA_DIR / "train.jsonl", TRAINING_DATA_DIR / "valid.jsonl"
 
 
 def check_mlx_lm():
-    """Check if mlx-lm is installed."""
-    try:
-        result = subprocess.run(
-            [sys.executable, "-m", "mlx_lm", "--help"],
-            capture_output=True,
-            text=True
-        )
-        return result.returncode == 0
-    except Exception:
-        return False
+    """Check if mlx-lm is installed (module lookup only, no import)."""
+    return importlib.util.find_spec("mlx_lm") is not None
 
 
 def install_mlx_lm():
@@ -103,23 +115,6 @@ def install_mlx_lm():
     ], check=True)
 
 
-def download_model():
-    """Download the base model for fine-tuning."""
-    print(f"Checking/downloading base model: {BASE_MODEL}")
-
-    # MLX-LM will download on first use, but we can pre-download
-    try:
-        subprocess.run([
-            sys.executable, "-m", "mlx_lm.convert",
-            "--hf-path", BASE_MODEL,
-            "--mlx-path", str(MODELS_DIR / "base"),
-            "-q"  # Quantize to 4-bit
-        ], check=True)
-        print(f"  Model downloaded to {MODELS_DIR / 'base'}")
-    except subprocess.CalledProcessError as e:
-        print(f"  Note: Model conversion may have issues, continuing anyway...")
-
-
 def run_finetuning(train_path: Path, valid_path: Path):
     """Run LoRA fine-tuning with MLX-LM."""
     print("\nStarting LoRA fine-tuning...")
@@ -149,24 +144,13 @@ def run_finetuning(train_path: Path, valid_path: Path):
         "--fine-tune-type", "lora",
     ]
 
-    if TRAIN_CONFIG.get("grad_checkpoint"):
-        cmd.append("--grad-checkpoint")
-
     print(f"\nRunning: {' '.join(cmd)}\n")
 
     try:
-        # Run with real-time output
-        process = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1
-        )
-
-        for line in iter(process.stdout.readline, ''):
-            print(line, end='')
-
+        # Child inherits our stdout, so training logs go straight to the terminal
+        # without being relayed line by line; flush first to keep output ordered
+        sys.stdout.flush()
+        process = subprocess.Popen(cmd, stderr=subprocess.STDOUT)
         process.wait()
 
         if process.returncode == 0:
@@ -181,6 +165,13 @@ def run_finetuning(train_path: Path, valid_path: Path):
         return None
 
 
+def training_context_messages() -> list:
+    """Messages that precede the user turn in the training data (the developer turn)."""
+    with open(TRAINING_DATA_DIR / "train.jsonl") as f:
+        messages = json.loads(f.readline())["messages"]
+    return [message for message in messages if message["role"] not in ("user", "model")]
+
+
 def test_finetuned_model(adapter_path: Path):
     """Test the fine-tuned model with sample commands."""
     print("\nTesting fine-tuned model...")
@@ -193,33 +184,37 @@ def test_finetuned_model(adapter_path: Path):
         "Task call mom at 3pm",
     ]
 
+    # Same developer turn the model was trained with
+    context = training_context_messages()
+
+    # Load base model + adapter once in-process and reuse it for every prompt
+    # (imported here since mlx-lm may have been installed by this run)
+    try:
+        from mlx_lm import generate, load
+        model, tokenizer = load(BASE_MODEL, adapter_path=str(adapter_path))
+    except Exception as e:
+        print(f"  Error loading model: {e}")
+        return
+
     for cmd in test_commands:
         print(f"\nInput: {cmd}")
         try:
-            result = subprocess.run([
-                sys.executable, "-m", "mlx_lm.generate",
-                "--model", BASE_MODEL,
-                "--adapter-path", str(adapter_path),
-                "--prompt", f"User command: {cmd}",
-                "--max-tokens", "100",
-                "--temp", "0.0"
-            ], capture_output=True, text=True, timeout=30)
-
-            if result.returncode == 0:
-                print(f"Output: {result.stdout.strip()}")
-            else:
-                print(f"Error: {result.stderr}")
-        except subprocess.TimeoutExpired:
-            print("  (timeout)")
+            # Prompt through the chat template, as in training (and as the
+            # mlx_lm.generate CLI did by default)
+            prompt = tokenizer.apply_chat_template(
+                context + [{"role": "user", "content": cmd}],
+                add_generation_prompt=True,
+                tokenize=False,
+            )
+            # Default sampler is greedy, i.e. temperature 0.0
+            output = generate(model, tokenizer, prompt=prompt, max_tokens=100)
+            print(f"Output: {output.strip()}")
         except Exception as e:
             print(f"  Error: {e}")
 
 
-def create_swift_model_config(adapter_path: Path):
-    """Create Swift configuration for loading the fine-tuned model."""
-    config_path = MODELS_DIR / "CosmoFunctionGemmaConfig.swift"
-
-    config_content = f'''// CosmoOS/Models/FunctionGemma/CosmoFunctionGemmaConfig.swift
+# Swift config template, rendered with str.format_map
+SWIFT_CONFIG_TEMPLATE = '''// CosmoOS/Models/FunctionGemma/CosmoFunctionGemmaConfig.swift
 // Auto-generated configuration for fine-tuned FunctionGemma model
 
 import Foundation
@@ -227,15 +222,15 @@ import Foundation
 /// Configuration for the CosmoOS fine-tuned FunctionGemma model
 public struct CosmoFunctionGemmaConfig {{
     /// Base model identifier
-    public static let baseModel = "{BASE_MODEL}"
+    public static let baseModel = "{base_model}"
 
     /// Path to LoRA adapter weights
     public static let adapterPath = "Models/FunctionGemma/adapters/cosmo-v1"
 
     /// LoRA configuration
-    public static let loraRank = {LORA_CONFIG["lora_rank"]}
-    public static let loraAlpha = {LORA_CONFIG["lora_alpha"]}
-    public static let loraLayers = {LORA_CONFIG["lora_layers"]}
+    public static let loraRank = {lora_rank}
+    public static let loraAlpha = {lora_alpha}
+    public static let loraLayers = {lora_layers}
 
     /// Target latency in milliseconds
     public static let targetLatencyMs = 300
@@ -244,11 +239,25 @@ public struct CosmoFunctionGemmaConfig {{
     public static let expectedRamMB = 550
 
     /// Training metadata
-    public static let trainingIterations = {TRAIN_CONFIG["iters"]}
-    public static let trainingDate = "{__import__('datetime').datetime.now().isoformat()}"
+    public static let trainingIterations = {iters}
+    public static let trainingDate = "{training_date}"
 }}
 '''
 
+
+def create_swift_model_config(adapter_path: Path, training_date: str):
+    """Create Swift configuration for loading the fine-tuned model."""
+    config_path = MODELS_DIR / "CosmoFunctionGemmaConfig.swift"
+
+    config_content = SWIFT_CONFIG_TEMPLATE.format_map({
+        "base_model": BASE_MODEL,
+        "lora_rank": LORA_CONFIG["lora_rank"],
+        "lora_alpha": LORA_CONFIG["lora_alpha"],
+        "lora_layers": LORA_CONFIG["lora_layers"],
+        "iters": TRAIN_CONFIG["iters"],
+        "training_date": training_date,
+    })
+
     MODELS_DIR.mkdir(parents=True, exist_ok=True)
     with open(config_path, 'w') as f:
         f.write(config_content)
@@ -257,6 +266,8 @@ public struct CosmoFunctionGemmaConfig {{
 
 
 def main():
+    run_timestamp = datetime.now().isoformat()
+
     print("=" * 60)
     print("CosmoOS FunctionGemma Fine-Tuning")
     print("=" * 60)
@@ -271,9 +282,8 @@ def main():
     print("\n[2/5] Preparing training data...")
     train_path, valid_path = prepare_training_data()
 
-    # Step 3: Download base model (optional, MLX-LM does this automatically)
+    # Step 3: Base model (MLX-LM downloads it during training)
     print("\n[3/5] Preparing base model...")
-    # download_model()  # Uncomment if you want to pre-download
     print("  Model will be downloaded during training")
 
     # Step 4: Run fine-tuning
@@ -284,7 +294,7 @@ def main():
         # Step 5: Test and create config
         print("\n[5/5] Testing and creating configuration...")
         test_finetuned_model(adapter_path)
-        create_swift_model_config(adapter_path)
+        create_swift_model_config(adapter_path, run_timestamp)
 
         print("\n" + "=" * 60)
         print("FINE-TUNING COMPLETE")
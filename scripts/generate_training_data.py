@@ -29,12 +29,36 @@ Usage:
     python generate_training_data.py
 """
 
+import collections
+import copy
+import functools
 import json
+import keyword
+import math
+import multiprocessing
 import random
 import os
+import re
+import string
+import sys
 from datetime import datetime, timedelta
 from pathlib import Path
 
+# orjson is optional. Both paths emit compact JSON with non-ASCII characters
+# escaped as \uXXXX, like json.dumps' default ensure_ascii=True (orjson has no
+# such option, so the rare non-ASCII record is re-dumped with json).
+try:
+    import orjson
+
+    def _dumps(obj):
+        data = orjson.dumps(obj)
+        if data.isascii():
+            return data
+        return json.dumps(obj, separators=(',', ':')).encode()
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, separators=(',', ':')).encode()
+
 # Output directory
 OUTPUT_DIR = Path(__file__).parent / "training_data"
 OUTPUT_DIR.mkdir(exist_ok=True)
@@ -50,13 +74,13 @@ You NEVER reason, explain, or generate text. You ONLY output function calls in t
 Available functions: create_atom, update_atom, delete_atom, search_atoms, batch_create, navigate, query_level_system, start_deep_work, stop_deep_work, extend_deep_work, log_workout, trigger_correlation_analysis"""
 
 
-def escape(value):
-    """Escape a value for FunctionGemma output format."""
-    if isinstance(value, dict):
-        return json.dumps(value, separators=(',', ':'))
-    elif isinstance(value, list):
-        return json.dumps(value, separators=(',', ':'))
-    elif isinstance(value, bool):
+@functools.lru_cache(maxsize=4096, typed=True)
+def _escape_hashable(value):
+    """Escape a scalar value; cached since values come from small data banks.
+
+    typed=True keeps True and 1 (equal and same hash) in separate entries.
+    """
+    if isinstance(value, bool):
         return "true" if value else "false"
     elif isinstance(value, (int, float)):
         return str(value)
@@ -64,20 +88,213 @@ def escape(value):
         return str(value)
 
 
+def escape(value):
+    """Escape a value for FunctionGemma output format."""
+    if isinstance(value, dict):
+        return _dumps(value).decode()
+    elif isinstance(value, list):
+        return _dumps(value).decode()
+    return _escape_hashable(value)
+
+
+ESCAPE_TOKEN = "<escape>"
+
+
 def make_function_call(func_name: str, params: dict) -> str:
     """Generate FunctionGemma output format string."""
-    param_parts = []
-    for key, value in params.items():
-        param_parts.append(f"{key}:<escape>{escape(value)}<escape>")
-    params_str = ",".join(param_parts)
+    # join turns a generator into a list anyway, so hand it one directly
+    params_str = ",".join([
+        f"{key}:{ESCAPE_TOKEN}{escape(value)}{ESCAPE_TOKEN}" for key, value in params.items()
+    ])
     return f"<start_function_call>call:{func_name}{{{params_str}}}<end_function_call>"
 
+
+def flatten_phrase_table(table):
+    """Flatten (label, [phrases]) pairs into (label, phrase) choices.
+
+    Returns the choices and integer cumulative weights for random.choices that
+    reproduce the two-step "pick a label, then one of its phrases" distribution
+    with a single draw.
+    """
+    scale = math.lcm(*(len(phrases) for _, phrases in table))
+    choices = []
+    cum_weights = []
+    total = 0
+    for label, phrases in table:
+        for phrase in phrases:
+            total += scale // len(phrases)
+            choices.append((label, phrase))
+            cum_weights.append(total)
+    return tuple(choices), tuple(cum_weights)
+
+
+def sample_values(templates, pools):
+    """Draw a values dict per compiled template, drawing only the fields it uses.
+
+    Each field is still drawn in one random.choices call, sized to the number
+    of chosen templates that need it.
+    """
+    counts = collections.Counter(field for _, fields in templates for field in fields)
+    streams = {field: iter(random.choices(pools[field], k=count)) for field, count in counts.items()}
+    return [{field: next(streams[field]) for field in fields} for _, fields in templates]
+
+
+# Consecutive duplicate candidates, per requested example, that unique_inputs
+# takes as a sign the input space is exhausted
+DEDUP_STALL_FACTOR = 1
+
+
+def unique_inputs(draw, n):
+    """Yield n examples with distinct inputs from draw(k), redrawing duplicates.
+
+    Keeps drawing until n distinct inputs are found. It stops short only on a
+    stall (DEDUP_STALL_FACTOR * n candidates in a row without a new input);
+    callers compare the count they get back against n to report it.
+    """
+    seen = set()
+    stale = 0
+    while len(seen) < n and stale < DEDUP_STALL_FACTOR * n:
+        for example in draw(n - len(seen)):
+            if example["input"] in seen:
+                stale += 1
+            else:
+                stale = 0
+                seen.add(example["input"])
+                yield example
+
+
+def template_fields(template):
+    """Placeholder names used anywhere in a template, in order of appearance."""
+    if isinstance(template, dict):
+        return tuple(dict.fromkeys(field for value in template.values() for field in template_fields(value)))
+    elif isinstance(template, list):
+        return tuple(dict.fromkeys(field for item in template for field in template_fields(item)))
+    elif isinstance(template, str):
+        # Interned so values dicts share key objects with the builders' constants
+        return tuple(dict.fromkeys(sys.intern(field) for _, field, _, _ in string.Formatter().parse(template) if field))
+    return ()
+
+
+# One shared instance per distinct placeholder-free dict or list, keyed by its
+# serialized JSON (unsorted, so key order stays part of the identity)
+_CANONICAL_CONSTANTS = {}
+
+
+def canonical_constant(value):
+    """Return the shared copy of a placeholder-free dict or list."""
+    key = _dumps(value)
+    if key not in _CANONICAL_CONSTANTS:
+        _CANONICAL_CONSTANTS[key] = copy.deepcopy(value)
+    return _CANONICAL_CONSTANTS[key]
+
+
+def template_source(template, shared=None):
+    """Python expression that rebuilds a template from its field variables.
+
+    When a shared dict is given, placeholder-free dicts and lists (including
+    a fully constant template) are bound in it to their canonical instance
+    and referenced by name rather than rebuilt.
+    """
+    if shared is not None and isinstance(template, (dict, list)) and template and not template_fields(template):
+        name = f"_shared{len(shared)}"
+        shared[name] = canonical_constant(template)
+        return name
+    if isinstance(template, dict):
+        return "{" + ", ".join(f"{key!r}: {template_source(value, shared)}" for key, value in template.items()) + "}"
+    elif isinstance(template, list):
+        return "[" + ", ".join(template_source(item, shared) for item in template) + "]"
+    elif isinstance(template, str):
+        parsed = list(string.Formatter().parse(template))
+        if not any(field for _, field, _, _ in parsed):
+            return repr("".join(literal for literal, _, _, _ in parsed))
+        if len(parsed) == 1 and not parsed[0][0]:
+            return parsed[0][1]
+        # An f-string joins all segments in one step instead of chained +
+        return "f" + repr("".join(
+            literal.replace("{", "{{").replace("}", "}}") + (f"{{{field}}}" if field else "")
+            for literal, field, _, _ in parsed
+        ))
+    return repr(template)
+
+
+def compile_function(fields, expression, template, namespace=None, ignore_extra=False):
+    """Compile a function with one parameter per field that returns expression.
+
+    With ignore_extra, unused keyword arguments are accepted and dropped.
+    """
+    for field in fields:
+        if not field.isidentifier() or keyword.iskeyword(field) or field == "unused":
+            raise ValueError(f"Unsupported placeholder {{{field}}} in {template!r}")
+    params = ", ".join(fields + ("**unused",) if ignore_extra else fields)
+    namespace = {} if namespace is None else namespace
+    exec(f"def build({params}):\n    return {expression}", namespace)
+    return namespace["build"]
+
+
+def compile_example(template, output):
+    """Generate a builder returning (input_text, output) for one template pair.
+
+    The builder is compiled once from source, so each call is plain string
+    concatenation plus a dict literal, with no format parsing or copying.
+    Its parameters are the template's fields, so it can be called with
+    field values positionally (in fields order) or by keyword.
+    Constant sub-dicts are shared between calls and must not be mutated.
+    """
+    fields = template_fields([template, output])
+    namespace = {}
+    expression = f"{template_source(template)}, {template_source(output, namespace)}"
+    return compile_function(fields, expression, template, namespace), fields
+
+
+def compile_phrase(template):
+    """Compile a phrase template into a function of its fields returning the text.
+
+    Like str.format, keyword arguments the template does not use are ignored.
+    """
+    return compile_function(template_fields(template), template_source(template), template, ignore_extra=True)
+
+
+def compile_templates(templates):
+    """Compile (input template, output template) pairs into (builder, fields) pairs."""
+    return tuple(compile_example(template, output) for template, output in templates)
+
+
+# Small vocabularies make (template, values) combinations repeat often
+RENDER_CACHE_SIZE = 65536
+
+
+@functools.lru_cache(maxsize=RENDER_CACHE_SIZE)
+def render_cached(template, field_values):
+    """Render a compiled template for field values given in its field order.
+
+    Repeated renders return the same output dict, which must not be mutated.
+    """
+    build_example, _ = template
+    return build_example(*field_values)
+
+
+def compile_weighted(*weighted_tables):
+    """Compile (table, weight) pairs into (templates, cum_weights) for random.choices.
+
+    Each template is compiled and stored once; its weight lives in the
+    cumulative weights rather than in repeated copies of the table.
+    """
+    templates = []
+    cum_weights = []
+    total = 0
+    for table, weight in weighted_tables:
+        for compiled in compile_templates(table):
+            total += weight
+            templates.append(compiled)
+            cum_weights.append(total)
+    return tuple(templates), tuple(cum_weights)
+
 # ============================================================================
 # DATA BANKS - Rich vocabulary for diverse training examples
 # ============================================================================
 
 # Topics for ideas
-TOPICS = [
+TOPICS = tuple(map(sys.intern, [
     # Business & Marketing
     "marketing strategy", "brand positioning", "customer acquisition", "retention metrics",
     "social media campaign", "content marketing", "SEO optimization", "email automation",
@@ -115,10 +332,10 @@ TOPICS = [
     # Research
     "user research", "market trends", "competitor analysis", "technology evaluation",
     "framework comparison", "best practices", "industry benchmarks", "case study analysis",
-]
+]))
 
 # Tasks for to-dos
-TASKS = [
+TASKS = tuple(map(sys.intern, [
     # Communication
     "call mom", "call dad", "call Sarah", "call John", "call the dentist",
     "email the team", "email investors", "email marketing", "email support",
@@ -146,19 +363,19 @@ TASKS = [
     # Errands
     "drop off mail", "go to bank", "visit post office", "get car serviced",
     "renew license", "update passport", "file taxes", "submit expense report",
-]
+]))
 
 # Standard project names (generic)
-PROJECTS = [
+PROJECTS = tuple(map(sys.intern, [
     "marketing", "product", "engineering", "design", "sales", "operations",
     "personal", "health", "finance", "learning", "side project", "home",
     "q1 goals", "q2 planning", "annual review", "strategic initiative",
     "app redesign", "backend migration", "mobile app", "web platform",
     "customer success", "support", "content", "growth", "partnerships",
-]
+]))
 
 # Person names (for "idea for Michael" type commands) - CRITICAL for project inbox
-PERSON_NAMES = [
+PERSON_NAMES = tuple(map(sys.intern, [
     # Common first names
     "Michael", "Sarah", "John", "Emily", "David", "Lisa", "James", "Jennifer",
     "Robert", "Jessica", "William", "Ashley", "Christopher", "Amanda", "Daniel",
@@ -168,14 +385,14 @@ PERSON_NAMES = [
     "Morgan", "Casey", "Jamie", "Cameron", "Drew", "Pat", "Quinn", "Riley",
     # Business/Professional
     "Dr. Smith", "Dr. Johnson", "Professor Lee", "Coach Williams",
-]
+]))
 
 # Company/Client names (for business contexts)
-COMPANY_NAMES = [
+COMPANY_NAMES = (
     "Acme", "TechCorp", "GlobalSoft", "Innovate Inc", "StartupX", "ClientCo",
     "PartnerGroup", "VentureOne", "CloudNine", "DataDriven", "NextGen",
     "BlueChip", "GreenLeaf", "RedRock", "SilverLine", "GoldStar",
-]
+)
 
 # Combined project references (person, company, or generic project)
 def get_project_references():
@@ -191,28 +408,31 @@ def get_project_references():
 
 PROJECT_REFERENCES = get_project_references()
 
+# Reference names for generators to sample from
+PROJECT_REF_NAMES = tuple(sys.intern(name) for name, _ in PROJECT_REFERENCES)
+
 # Time expressions
-TIMES = [
+TIMES = tuple(map(sys.intern, [
     "9am", "10am", "11am", "12pm", "1pm", "2pm", "3pm", "4pm", "5pm", "6pm",
     "9", "10", "11", "12", "1", "2", "3", "4", "5", "6",
     "9:30", "10:30", "11:30", "12:30", "1:30", "2:30", "3:30", "4:30",
     "morning", "afternoon", "evening", "noon", "end of day", "close of business",
-]
+]))
 
-RELATIVE_TIMES = [
+RELATIVE_TIMES = tuple(map(sys.intern, [
     "tomorrow", "next week", "next Monday", "next Tuesday", "next Wednesday",
     "this Friday", "this weekend", "in an hour", "in 2 hours", "in 30 minutes",
     "later today", "tonight", "this evening", "next month", "end of week",
-]
+]))
 
-DURATIONS = [
+DURATIONS = (
     ("30 minutes", 30), ("1 hour", 60), ("1.5 hours", 90), ("2 hours", 120),
     ("45 minutes", 45), ("15 minutes", 15), ("3 hours", 180), ("half hour", 30),
     ("an hour", 60), ("couple hours", 120),
-]
+)
 
 # Priorities
-PRIORITIES = ["low", "medium", "high"]
+PRIORITIES = ("low", "medium", "high")
 PRIORITY_PHRASES = {
     "low": ["low priority", "not urgent", "when I get to it", "optional"],
     "medium": ["medium priority", "normal priority", "regular", "standard"],
@@ -220,726 +440,826 @@ PRIORITY_PHRASES = {
 }
 
 # Block types
-BLOCK_TYPES = [
-    ("focus", ["deep work", "focused time", "heads down", "no meetings", "concentration time"]),
-    ("task", ["work block", "task time", "working on", "getting things done"]),
-    ("event", ["meeting", "call", "sync", "standup", "review", "interview", "lunch", "coffee"]),
-]
+BLOCK_TYPES = (
+    ("focus", ("deep work", "focused time", "heads down", "no meetings", "concentration time")),
+    ("task", ("work block", "task time", "working on", "getting things done")),
+    ("event", ("meeting", "call", "sync", "standup", "review", "interview", "lunch", "coffee")),
+)
 
 # Modification actions
-STATUS_CHANGES = [
-    ("completed", ["mark as complete", "mark as done", "done", "finished", "complete this", "check off"]),
-    ("in_progress", ["start working on", "in progress", "working on it", "started"]),
-    ("todo", ["put back to todo", "reopen", "undo complete", "not done yet"]),
-]
+STATUS_CHANGES = (
+    ("completed", ("mark as complete", "mark as done", "done", "finished", "complete this", "check off")),
+    ("in_progress", ("start working on", "in progress", "working on it", "started")),
+    ("todo", ("put back to todo", "reopen", "undo complete", "not done yet")),
+)
 
 # ============================================================================
 # TEMPLATE GENERATORS
 # ============================================================================
 
-def generate_simple_creation_examples(n=3500):
-    """Generate simple entity creation examples (no time expressions, no project)."""
-    examples = []
+# Idea creation templates
+IDEA_TEMPLATES = (
+    ("Create idea about {topic}", {"action": "create", "type": "idea", "title": "{topic}"}),
+    ("New idea about {topic}", {"action": "create", "type": "idea", "title": "{topic}"}),
+    ("Add idea for {topic}", {"action": "create", "type": "idea", "title": "{topic}"}),
+    ("Jot down idea about {topic}", {"action": "create", "type": "idea", "title": "{topic}"}),
+    ("Note about {topic}", {"action": "create", "type": "idea", "title": "{topic}"}),
+    ("I have an idea about {topic}", {"action": "create", "type": "idea", "title": "{topic}"}),
+    ("Thought about {topic}", {"action": "create", "type": "idea", "title": "{topic}"}),
+    ("Add thought on {topic}", {"action": "create", "type": "idea", "title": "{topic}"}),
+    ("Capture idea for {topic}", {"action": "create", "type": "idea", "title": "{topic}"}),
+    ("Quick idea {topic}", {"action": "create", "type": "idea", "title": "{topic}"}),
+    ("Idea {topic}", {"action": "create", "type": "idea", "title": "{topic}"}),
+    ("{topic} idea", {"action": "create", "type": "idea", "title": "{topic}"}),
+    ("Brain dump about {topic}", {"action": "create", "type": "idea", "title": "{topic}"}),
+    ("Let me note down {topic}", {"action": "create", "type": "idea", "title": "{topic}"}),
+    ("Save idea about {topic}", {"action": "create", "type": "idea", "title": "{topic}"}),
+)
+
+# Task creation templates
+TASK_TEMPLATES = (
+    ("Create task {task}", {"action": "create", "type": "task", "title": "{task}"}),
+    ("New task {task}", {"action": "create", "type": "task", "title": "{task}"}),
+    ("Add task {task}", {"action": "create", "type": "task", "title": "{task}"}),
+    ("I need to {task}", {"action": "create", "type": "task", "title": "{task}"}),
+    ("Remind me to {task}", {"action": "create", "type": "task", "title": "{task}"}),
+    ("Don't let me forget to {task}", {"action": "create", "type": "task", "title": "{task}"}),
+    ("Add to my list {task}", {"action": "create", "type": "task", "title": "{task}"}),
+    ("Todo {task}", {"action": "create", "type": "task", "title": "{task}"}),
+    ("To do {task}", {"action": "create", "type": "task", "title": "{task}"}),
+    ("{task}", {"action": "create", "type": "task", "title": "{task}"}),  # Bare command
+    ("Make sure I {task}", {"action": "create", "type": "task", "title": "{task}"}),
+    ("Put on my list {task}", {"action": "create", "type": "task", "title": "{task}"}),
+    ("Add {task} to tasks", {"action": "create", "type": "task", "title": "{task}"}),
+    ("Task to {task}", {"action": "create", "type": "task", "title": "{task}"}),
+    ("Need to {task}", {"action": "create", "type": "task", "title": "{task}"}),
+)
+
+# Project creation templates
+PROJECT_TEMPLATES = (
+    ("Create project called {project}", {"action": "create", "type": "project", "title": "{project}"}),
+    ("New project {project}", {"action": "create", "type": "project", "title": "{project}"}),
+    ("Start a project for {project}", {"action": "create", "type": "project", "title": "{project}"}),
+    ("Add project {project}", {"action": "create", "type": "project", "title": "{project}"}),
+)
+
+# Research creation templates
+RESEARCH_TEMPLATES = (
+    ("Save this article about {topic}", {"action": "create", "type": "research", "title": "{topic}"}),
+    ("Add to research {topic}", {"action": "create", "type": "research", "title": "{topic}"}),
+    ("Research about {topic}", {"action": "create", "type": "research", "title": "{topic}"}),
+    ("Look into {topic}", {"action": "create", "type": "research", "title": "{topic}"}),
+    ("Investigate {topic}", {"action": "create", "type": "research", "title": "{topic}"}),
+)
+
+# Note creation templates (floating blocks in Thinkspace)
+NOTE_TEMPLATES = (
+    ("Create note about {topic}", {"action": "create", "type": "note", "title": "{topic}"}),
+    ("New note {topic}", {"action": "create", "type": "note", "title": "{topic}"}),
+    ("Add note about {topic}", {"action": "create", "type": "note", "title": "{topic}"}),
+    ("Quick note {topic}", {"action": "create", "type": "note", "title": "{topic}"}),
+    ("Note {topic}", {"action": "create", "type": "note", "title": "{topic}"}),
+    ("Floating note {topic}", {"action": "create", "type": "note", "title": "{topic}"}),
+    ("Add floating note about {topic}", {"action": "create", "type": "note", "title": "{topic}"}),
+    ("Drop a note about {topic}", {"action": "create", "type": "note", "title": "{topic}"}),
+)
+
+# Thinkspace creation templates (saved canvas configurations)
+THINKSPACE_TEMPLATES = (
+    ("Create thinkspace for {topic}", {"action": "create", "type": "thinkspace", "title": "{topic}"}),
+    ("New thinkspace {topic}", {"action": "create", "type": "thinkspace", "title": "{topic}"}),
+    ("Add thinkspace about {topic}", {"action": "create", "type": "thinkspace", "title": "{topic}"}),
+    ("Create canvas for {topic}", {"action": "create", "type": "thinkspace", "title": "{topic}"}),
+    ("New canvas {topic}", {"action": "create", "type": "thinkspace", "title": "{topic}"}),
+    ("Start a thinkspace for {topic}", {"action": "create", "type": "thinkspace", "title": "{topic}"}),
+    ("Make a thinking space for {topic}", {"action": "create", "type": "thinkspace", "title": "{topic}"}),
+)
+
+# Connection creation templates (mental models)
+CONNECTION_TEMPLATES = (
+    ("Create connection about {topic}", {"action": "create", "type": "connection", "title": "{topic}"}),
+    ("New connection {topic}", {"action": "create", "type": "connection", "title": "{topic}"}),
+    ("Add connection for {topic}", {"action": "create", "type": "connection", "title": "{topic}"}),
+    ("Mental model for {topic}", {"action": "create", "type": "connection", "title": "{topic}"}),
+    ("Create mental model about {topic}", {"action": "create", "type": "connection", "title": "{topic}"}),
+    ("Link {topic}", {"action": "create", "type": "connection", "title": "{topic}"}),
+    ("Connect {topic}", {"action": "create", "type": "connection", "title": "{topic}"}),
+)
+
+# Idea creation with priority
+IDEA_PRIORITY_TEMPLATES = (
+    ("Create {priority} priority idea about {topic}", {"action": "create", "type": "idea", "title": "{topic}", "metadata": {"priority": "{priority}"}}),
+    ("High priority idea about {topic}", {"action": "create", "type": "idea", "title": "{topic}", "metadata": {"priority": "high"}}),
+    ("Important idea about {topic}", {"action": "create", "type": "idea", "title": "{topic}", "metadata": {"priority": "high"}}),
+)
+
+# Task creation with priority
+TASK_PRIORITY_TEMPLATES = (
+    ("Urgent task {task}", {"action": "create", "type": "task", "title": "{task}", "metadata": {"priority": "high"}}),
+    ("High priority {task}", {"action": "create", "type": "task", "title": "{task}", "metadata": {"priority": "high"}}),
+    ("Low priority {task}", {"action": "create", "type": "task", "title": "{task}", "metadata": {"priority": "low"}}),
+    ("Important {task}", {"action": "create", "type": "task", "title": "{task}", "metadata": {"priority": "high"}}),
+    ("When I get to it {task}", {"action": "create", "type": "task", "title": "{task}", "metadata": {"priority": "low"}}),
+)
+
+
+# Compiled on first use, so a worker only builds the tables its category needs
+@functools.lru_cache(maxsize=None)
+def simple_creation_templates():
+    """Compiled simple creation templates, weighted across template kinds.
+
+    Returns (templates, cum_weights) for random.choices.
+    """
+    # Distribute examples across templates
+    return compile_weighted(
+        (IDEA_TEMPLATES, 3),  # More weight on ideas
+        (TASK_TEMPLATES, 4),  # Most weight on tasks
+        (PROJECT_TEMPLATES, 1),
+        (RESEARCH_TEMPLATES, 1),
+        (NOTE_TEMPLATES, 2),  # Floating notes are common
+        (THINKSPACE_TEMPLATES, 1),  # Canvas/thinkspace creation
+        (CONNECTION_TEMPLATES, 1),  # Mental models
+        (IDEA_PRIORITY_TEMPLATES, 1),
+        (TASK_PRIORITY_TEMPLATES, 1),
+    )
 
-    # Idea creation templates
-    idea_templates = [
-        ("Create idea about {topic}", {"action": "create", "type": "idea", "title": "{topic}"}),
-        ("New idea about {topic}", {"action": "create", "type": "idea", "title": "{topic}"}),
-        ("Add idea for {topic}", {"action": "create", "type": "idea", "title": "{topic}"}),
-        ("Jot down idea about {topic}", {"action": "create", "type": "idea", "title": "{topic}"}),
-        ("Note about {topic}", {"action": "create", "type": "idea", "title": "{topic}"}),
-        ("I have an idea about {topic}", {"action": "create", "type": "idea", "title": "{topic}"}),
-        ("Thought about {topic}", {"action": "create", "type": "idea", "title": "{topic}"}),
-        ("Add thought on {topic}", {"action": "create", "type": "idea", "title": "{topic}"}),
-        ("Capture idea for {topic}", {"action": "create", "type": "idea", "title": "{topic}"}),
-        ("Quick idea {topic}", {"action": "create", "type": "idea", "title": "{topic}"}),
-        ("Idea {topic}", {"action": "create", "type": "idea", "title": "{topic}"}),
-        ("{topic} idea", {"action": "create", "type": "idea", "title": "{topic}"}),
-        ("Brain dump about {topic}", {"action": "create", "type": "idea", "title": "{topic}"}),
-        ("Let me note down {topic}", {"action": "create", "type": "idea", "title": "{topic}"}),
-        ("Save idea about {topic}", {"action": "create", "type": "idea", "title": "{topic}"}),
-    ]
 
-    # Task creation templates
-    task_templates = [
-        ("Create task {task}", {"action": "create", "type": "task", "title": "{task}"}),
-        ("New task {task}", {"action": "create", "type": "task", "title": "{task}"}),
-        ("Add task {task}", {"action": "create", "type": "task", "title": "{task}"}),
-        ("I need to {task}", {"action": "create", "type": "task", "title": "{task}"}),
-        ("Remind me to {task}", {"action": "create", "type": "task", "title": "{task}"}),
-        ("Don't let me forget to {task}", {"action": "create", "type": "task", "title": "{task}"}),
-        ("Add to my list {task}", {"action": "create", "type": "task", "title": "{task}"}),
-        ("Todo {task}", {"action": "create", "type": "task", "title": "{task}"}),
-        ("To do {task}", {"action": "create", "type": "task", "title": "{task}"}),
-        ("{task}", {"action": "create", "type": "task", "title": "{task}"}),  # Bare command
-        ("Make sure I {task}", {"action": "create", "type": "task", "title": "{task}"}),
-        ("Put on my list {task}", {"action": "create", "type": "task", "title": "{task}"}),
-        ("Add {task} to tasks", {"action": "create", "type": "task", "title": "{task}"}),
-        ("Task to {task}", {"action": "create", "type": "task", "title": "{task}"}),
-        ("Need to {task}", {"action": "create", "type": "task", "title": "{task}"}),
-    ]
+# Vocabulary each simple creation placeholder draws from
+SIMPLE_CREATION_FIELDS = {"topic": TOPICS, "task": TASKS, "project": PROJECTS, "priority": PRIORITIES}
 
-    # Project creation templates
-    project_templates = [
-        ("Create project called {project}", {"action": "create", "type": "project", "title": "{project}"}),
-        ("New project {project}", {"action": "create", "type": "project", "title": "{project}"}),
-        ("Start a project for {project}", {"action": "create", "type": "project", "title": "{project}"}),
-        ("Add project {project}", {"action": "create", "type": "project", "title": "{project}"}),
-    ]
 
-    # Research creation templates
-    research_templates = [
-        ("Save this article about {topic}", {"action": "create", "type": "research", "title": "{topic}"}),
-        ("Add to research {topic}", {"action": "create", "type": "research", "title": "{topic}"}),
-        ("Research about {topic}", {"action": "create", "type": "research", "title": "{topic}"}),
-        ("Look into {topic}", {"action": "create", "type": "research", "title": "{topic}"}),
-        ("Investigate {topic}", {"action": "create", "type": "research", "title": "{topic}"}),
-    ]
+def iter_simple_creation_examples(n=3500):
+    """Yield simple entity creation examples (no time expressions, no project)."""
+    return unique_inputs(_draw_simple_creation_examples, n)
 
-    # Note creation templates (floating blocks in Thinkspace)
-    note_templates = [
-        ("Create note about {topic}", {"action": "create", "type": "note", "title": "{topic}"}),
-        ("New note {topic}", {"action": "create", "type": "note", "title": "{topic}"}),
-        ("Add note about {topic}", {"action": "create", "type": "note", "title": "{topic}"}),
-        ("Quick note {topic}", {"action": "create", "type": "note", "title": "{topic}"}),
-        ("Note {topic}", {"action": "create", "type": "note", "title": "{topic}"}),
-        ("Floating note {topic}", {"action": "create", "type": "note", "title": "{topic}"}),
-        ("Add floating note about {topic}", {"action": "create", "type": "note", "title": "{topic}"}),
-        ("Drop a note about {topic}", {"action": "create", "type": "note", "title": "{topic}"}),
-    ]
 
-    # Thinkspace creation templates (saved canvas configurations)
-    thinkspace_templates = [
-        ("Create thinkspace for {topic}", {"action": "create", "type": "thinkspace", "title": "{topic}"}),
-        ("New thinkspace {topic}", {"action": "create", "type": "thinkspace", "title": "{topic}"}),
-        ("Add thinkspace about {topic}", {"action": "create", "type": "thinkspace", "title": "{topic}"}),
-        ("Create canvas for {topic}", {"action": "create", "type": "thinkspace", "title": "{topic}"}),
-        ("New canvas {topic}", {"action": "create", "type": "thinkspace", "title": "{topic}"}),
-        ("Start a thinkspace for {topic}", {"action": "create", "type": "thinkspace", "title": "{topic}"}),
-        ("Make a thinking space for {topic}", {"action": "create", "type": "thinkspace", "title": "{topic}"}),
-    ]
+def _draw_simple_creation_examples(n):
+    """Yield n candidate examples; inputs may repeat."""
+    # Pick all templates up front, then draw only the fields they use
+    templates, cum_weights = simple_creation_templates()
+    templates = random.choices(templates, cum_weights=cum_weights, k=n)
+    field_values = sample_values(templates, SIMPLE_CREATION_FIELDS)
 
-    # Connection creation templates (mental models)
-    connection_templates = [
-        ("Create connection about {topic}", {"action": "create", "type": "connection", "title": "{topic}"}),
-        ("New connection {topic}", {"action": "create", "type": "connection", "title": "{topic}"}),
-        ("Add connection for {topic}", {"action": "create", "type": "connection", "title": "{topic}"}),
-        ("Mental model for {topic}", {"action": "create", "type": "connection", "title": "{topic}"}),
-        ("Create mental model about {topic}", {"action": "create", "type": "connection", "title": "{topic}"}),
-        ("Link {topic}", {"action": "create", "type": "connection", "title": "{topic}"}),
-        ("Connect {topic}", {"action": "create", "type": "connection", "title": "{topic}"}),
-    ]
+    for (build_example, _), values in zip(templates, field_values):
+        input_text, output = build_example(**values)
 
-    # Idea creation with priority
-    idea_priority_templates = [
-        ("Create {priority} priority idea about {topic}", {"action": "create", "type": "idea", "title": "{topic}", "metadata": {"priority": "{priority}"}}),
-        ("High priority idea about {topic}", {"action": "create", "type": "idea", "title": "{topic}", "metadata": {"priority": "high"}}),
-        ("Important idea about {topic}", {"action": "create", "type": "idea", "title": "{topic}", "metadata": {"priority": "high"}}),
-    ]
+        yield {"input": input_text, "output": output}
 
-    # Task creation with priority
-    task_priority_templates = [
-        ("Urgent task {task}", {"action": "create", "type": "task", "title": "{task}", "metadata": {"priority": "high"}}),
-        ("High priority {task}", {"action": "create", "type": "task", "title": "{task}", "metadata": {"priority": "high"}}),
-        ("Low priority {task}", {"action": "create", "type": "task", "title": "{task}", "metadata": {"priority": "low"}}),
-        ("Important {task}", {"action": "create", "type": "task", "title": "{task}", "metadata": {"priority": "high"}}),
-        ("When I get to it {task}", {"action": "create", "type": "task", "title": "{task}", "metadata": {"priority": "low"}}),
-    ]
 
-    # Distribute examples across templates
-    all_templates = (
-        idea_templates * 3 +  # More weight on ideas
-        task_templates * 4 +  # Most weight on tasks
-        project_templates +
-        research_templates +
-        note_templates * 2 +  # Floating notes are common
-        thinkspace_templates +  # Canvas/thinkspace creation
-        connection_templates +  # Mental models
-        idea_priority_templates +
-        task_priority_templates
-    )
+def generate_simple_creation_examples(n=3500):
+    """List form of iter_simple_creation_examples."""
+    return list(iter_simple_creation_examples(n))
 
-    for _ in range(n):
-        template, output_template = random.choice(all_templates)
-        topic = random.choice(TOPICS)
-        task = random.choice(TASKS)
-        project = random.choice(PROJECTS)
-        priority = random.choice(PRIORITIES)
 
-        input_text = template.format(topic=topic, task=task, project=project, priority=priority)
+# ==================== IDEA FOR [PROJECT] ====================
+# These are the most common - someone capturing an idea for a specific person/project
+
+IDEA_FOR_PROJECT_TEMPLATES = (
+    # "Idea for X" pattern (most natural)
+    ("Idea for {project_ref} {topic}", {"action": "create", "type": "idea", "title": "{topic}", "links": [{"type": "project", "query": "{project_ref}"}]}),
+    ("Idea for {project_ref} about {topic}", {"action": "create", "type": "idea", "title": "{topic}", "links": [{"type": "project", "query": "{project_ref}"}]}),
+    ("Idea for {project_ref}: {topic}", {"action": "create", "type": "idea", "title": "{topic}", "links": [{"type": "project", "query": "{project_ref}"}]}),
 
-        # Deep copy and substitute
-        output_str = json.dumps(output_template)
-        output_str = output_str.replace("{topic}", topic)
-        output_str = output_str.replace("{task}", task)
-        output_str = output_str.replace("{project}", project)
-        output_str = output_str.replace("{priority}", priority)
-        output = json.loads(output_str)
+    # "New idea for X"
+    ("New idea for {project_ref} {topic}", {"action": "create", "type": "idea", "title": "{topic}", "links": [{"type": "project", "query": "{project_ref}"}]}),
+    ("New idea for {project_ref} about {topic}", {"action": "create", "type": "idea", "title": "{topic}", "links": [{"type": "project", "query": "{project_ref}"}]}),
 
-        examples.append({"input": input_text, "output": output})
+    # "I just got/had this idea for X"
+    ("I just got this idea for {project_ref} {topic}", {"action": "create", "type": "idea", "title": "{topic}", "links": [{"type": "project", "query": "{project_ref}"}]}),
+    ("I just had this idea for {project_ref} {topic}", {"action": "create", "type": "idea", "title": "{topic}", "links": [{"type": "project", "query": "{project_ref}"}]}),
+    ("Just got an idea for {project_ref} {topic}", {"action": "create", "type": "idea", "title": "{topic}", "links": [{"type": "project", "query": "{project_ref}"}]}),
+    ("Just had a thought for {project_ref} {topic}", {"action": "create", "type": "idea", "title": "{topic}", "links": [{"type": "project", "query": "{project_ref}"}]}),
 
-    return examples
+    # "Thought for X"
+    ("Thought for {project_ref} {topic}", {"action": "create", "type": "idea", "title": "{topic}", "links": [{"type": "project", "query": "{project_ref}"}]}),
+    ("Quick thought for {project_ref} {topic}", {"action": "create", "type": "idea", "title": "{topic}", "links": [{"type": "project", "query": "{project_ref}"}]}),
 
+    # "Note for X"
+    ("Note for {project_ref} {topic}", {"action": "create", "type": "idea", "title": "{topic}", "links": [{"type": "project", "query": "{project_ref}"}]}),
+    ("Add note for {project_ref} {topic}", {"action": "create", "type": "idea", "title": "{topic}", "links": [{"type": "project", "query": "{project_ref}"}]}),
 
-def generate_project_specific_examples(n=2500):
-    """
-    Generate project-specific entity creation examples.
-    This is CRITICAL for commands like:
-    - "Idea for Michael about user onboarding"
-    - "I just had this thought for Sarah"
-    - "Task for marketing project"
-    - "Add to Acme inbox"
-    """
-    examples = []
+    # "Add to X"
+    ("Add to {project_ref} {topic}", {"action": "create", "type": "idea", "title": "{topic}", "links": [{"type": "project", "query": "{project_ref}"}]}),
+    ("Add to {project_ref} inbox {topic}", {"action": "create", "type": "idea", "title": "{topic}", "links": [{"type": "project", "query": "{project_ref}"}]}),
+    ("Put in {project_ref} inbox {topic}", {"action": "create", "type": "idea", "title": "{topic}", "links": [{"type": "project", "query": "{project_ref}"}]}),
 
-    # ==================== IDEA FOR [PROJECT] ====================
-    # These are the most common - someone capturing an idea for a specific person/project
-
-    idea_for_project_templates = [
-        # "Idea for X" pattern (most natural)
-        ("Idea for {project_ref} {topic}", {"action": "create", "type": "idea", "title": "{topic}", "links": [{"type": "project", "query": "{project_ref}"}]}),
-        ("Idea for {project_ref} about {topic}", {"action": "create", "type": "idea", "title": "{topic}", "links": [{"type": "project", "query": "{project_ref}"}]}),
-        ("Idea for {project_ref}: {topic}", {"action": "create", "type": "idea", "title": "{topic}", "links": [{"type": "project", "query": "{project_ref}"}]}),
-
-        # "New idea for X"
-        ("New idea for {project_ref} {topic}", {"action": "create", "type": "idea", "title": "{topic}", "links": [{"type": "project", "query": "{project_ref}"}]}),
-        ("New idea for {project_ref} about {topic}", {"action": "create", "type": "idea", "title": "{topic}", "links": [{"type": "project", "query": "{project_ref}"}]}),
-
-        # "I just got/had this idea for X"
-        ("I just got this idea for {project_ref} {topic}", {"action": "create", "type": "idea", "title": "{topic}", "links": [{"type": "project", "query": "{project_ref}"}]}),
-        ("I just had this idea for {project_ref} {topic}", {"action": "create", "type": "idea", "title": "{topic}", "links": [{"type": "project", "query": "{project_ref}"}]}),
-        ("Just got an idea for {project_ref} {topic}", {"action": "create", "type": "idea", "title": "{topic}", "links": [{"type": "project", "query": "{project_ref}"}]}),
-        ("Just had a thought for {project_ref} {topic}", {"action": "create", "type": "idea", "title": "{topic}", "links": [{"type": "project", "query": "{project_ref}"}]}),
-
-        # "Thought for X"
-        ("Thought for {project_ref} {topic}", {"action": "create", "type": "idea", "title": "{topic}", "links": [{"type": "project", "query": "{project_ref}"}]}),
-        ("Quick thought for {project_ref} {topic}", {"action": "create", "type": "idea", "title": "{topic}", "links": [{"type": "project", "query": "{project_ref}"}]}),
-
-        # "Note for X"
-        ("Note for {project_ref} {topic}", {"action": "create", "type": "idea", "title": "{topic}", "links": [{"type": "project", "query": "{project_ref}"}]}),
-        ("Add note for {project_ref} {topic}", {"action": "create", "type": "idea", "title": "{topic}", "links": [{"type": "project", "query": "{project_ref}"}]}),
-
-        # "Add to X"
-        ("Add to {project_ref} {topic}", {"action": "create", "type": "idea", "title": "{topic}", "links": [{"type": "project", "query": "{project_ref}"}]}),
-        ("Add to {project_ref} inbox {topic}", {"action": "create", "type": "idea", "title": "{topic}", "links": [{"type": "project", "query": "{project_ref}"}]}),
-        ("Put in {project_ref} inbox {topic}", {"action": "create", "type": "idea", "title": "{topic}", "links": [{"type": "project", "query": "{project_ref}"}]}),
-
-        # "For X" at the start
-        ("For {project_ref} {topic}", {"action": "create", "type": "idea", "title": "{topic}", "links": [{"type": "project", "query": "{project_ref}"}]}),
-        ("For {project_ref} idea about {topic}", {"action": "create", "type": "idea", "title": "{topic}", "links": [{"type": "project", "query": "{project_ref}"}]}),
-
-        # With "project" suffix
-        ("Idea for {project_ref} project {topic}", {"action": "create", "type": "idea", "title": "{topic}", "links": [{"type": "project", "query": "{project_ref}"}]}),
-        ("Add idea to {project_ref} project {topic}", {"action": "create", "type": "idea", "title": "{topic}", "links": [{"type": "project", "query": "{project_ref}"}]}),
-
-        # Capture/save patterns
-        ("Capture for {project_ref} {topic}", {"action": "create", "type": "idea", "title": "{topic}", "links": [{"type": "project", "query": "{project_ref}"}]}),
-        ("Save for {project_ref} {topic}", {"action": "create", "type": "idea", "title": "{topic}", "links": [{"type": "project", "query": "{project_ref}"}]}),
-    ]
+    # "For X" at the start
+    ("For {project_ref} {topic}", {"action": "create", "type": "idea", "title": "{topic}", "links": [{"type": "project", "query": "{project_ref}"}]}),
+    ("For {project_ref} idea about {topic}", {"action": "create", "type": "idea", "title": "{topic}", "links": [{"type": "project", "query": "{project_ref}"}]}),
 
-    # ==================== TASK FOR [PROJECT] ====================
+    # With "project" suffix
+    ("Idea for {project_ref} project {topic}", {"action": "create", "type": "idea", "title": "{topic}", "links": [{"type": "project", "query": "{project_ref}"}]}),
+    ("Add idea to {project_ref} project {topic}", {"action": "create", "type": "idea", "title": "{topic}", "links": [{"type": "project", "query": "{project_ref}"}]}),
 
-    task_for_project_templates = [
-        # "Task for X"
-        ("Task for {project_ref} {task}", {"action": "create", "type": "task", "title": "{task}", "links": [{"type": "project", "query": "{project_ref}"}]}),
-        ("New task for {project_ref} {task}", {"action": "create", "type": "task", "title": "{task}", "links": [{"type": "project", "query": "{project_ref}"}]}),
-        ("Add task for {project_ref} {task}", {"action": "create", "type": "task", "title": "{task}", "links": [{"type": "project", "query": "{project_ref}"}]}),
+    # Capture/save patterns
+    ("Capture for {project_ref} {topic}", {"action": "create", "type": "idea", "title": "{topic}", "links": [{"type": "project", "query": "{project_ref}"}]}),
+    ("Save for {project_ref} {topic}", {"action": "create", "type": "idea", "title": "{topic}", "links": [{"type": "project", "query": "{project_ref}"}]}),
+)
 
-        # "Task to X for Y"
-        ("Add task to {project_ref} {task}", {"action": "create", "type": "task", "title": "{task}", "links": [{"type": "project", "query": "{project_ref}"}]}),
-        ("Create task in {project_ref} {task}", {"action": "create", "type": "task", "title": "{task}", "links": [{"type": "project", "query": "{project_ref}"}]}),
+# ==================== TASK FOR [PROJECT] ====================
 
-        # "For X" at start
-        ("For {project_ref} {task}", {"action": "create", "type": "task", "title": "{task}", "links": [{"type": "project", "query": "{project_ref}"}]}),
-        ("For {project_ref} task to {task}", {"action": "create", "type": "task", "title": "{task}", "links": [{"type": "project", "query": "{project_ref}"}]}),
+TASK_FOR_PROJECT_TEMPLATES = (
+    # "Task for X"
+    ("Task for {project_ref} {task}", {"action": "create", "type": "task", "title": "{task}", "links": [{"type": "project", "query": "{project_ref}"}]}),
+    ("New task for {project_ref} {task}", {"action": "create", "type": "task", "title": "{task}", "links": [{"type": "project", "query": "{project_ref}"}]}),
+    ("Add task for {project_ref} {task}", {"action": "create", "type": "task", "title": "{task}", "links": [{"type": "project", "query": "{project_ref}"}]}),
 
-        # "I need to X for Y"
-        ("I need to {task} for {project_ref}", {"action": "create", "type": "task", "title": "{task}", "links": [{"type": "project", "query": "{project_ref}"}]}),
-        ("Need to {task} for {project_ref}", {"action": "create", "type": "task", "title": "{task}", "links": [{"type": "project", "query": "{project_ref}"}]}),
+    # "Task to X for Y"
+    ("Add task to {project_ref} {task}", {"action": "create", "type": "task", "title": "{task}", "links": [{"type": "project", "query": "{project_ref}"}]}),
+    ("Create task in {project_ref} {task}", {"action": "create", "type": "task", "title": "{task}", "links": [{"type": "project", "query": "{project_ref}"}]}),
 
-        # "Remind me for X"
-        ("Remind me for {project_ref} to {task}", {"action": "create", "type": "task", "title": "{task}", "links": [{"type": "project", "query": "{project_ref}"}]}),
+    # "For X" at start
+    ("For {project_ref} {task}", {"action": "create", "type": "task", "title": "{task}", "links": [{"type": "project", "query": "{project_ref}"}]}),
+    ("For {project_ref} task to {task}", {"action": "create", "type": "task", "title": "{task}", "links": [{"type": "project", "query": "{project_ref}"}]}),
 
-        # With "project" suffix
-        ("Task for {project_ref} project {task}", {"action": "create", "type": "task", "title": "{task}", "links": [{"type": "project", "query": "{project_ref}"}]}),
-        ("{task} for {project_ref} project", {"action": "create", "type": "task", "title": "{task}", "links": [{"type": "project", "query": "{project_ref}"}]}),
+    # "I need to X for Y"
+    ("I need to {task} for {project_ref}", {"action": "create", "type": "task", "title": "{task}", "links": [{"type": "project", "query": "{project_ref}"}]}),
+    ("Need to {task} for {project_ref}", {"action": "create", "type": "task", "title": "{task}", "links": [{"type": "project", "query": "{project_ref}"}]}),
 
-        # Todo patterns
-        ("Todo for {project_ref} {task}", {"action": "create", "type": "task", "title": "{task}", "links": [{"type": "project", "query": "{project_ref}"}]}),
-        ("To do for {project_ref} {task}", {"action": "create", "type": "task", "title": "{task}", "links": [{"type": "project", "query": "{project_ref}"}]}),
-    ]
+    # "Remind me for X"
+    ("Remind me for {project_ref} to {task}", {"action": "create", "type": "task", "title": "{task}", "links": [{"type": "project", "query": "{project_ref}"}]}),
 
-    # ==================== RESEARCH FOR [PROJECT] ====================
+    # With "project" suffix
+    ("Task for {project_ref} project {task}", {"action": "create", "type": "task", "title": "{task}", "links": [{"type": "project", "query": "{project_ref}"}]}),
+    ("{task} for {project_ref} project", {"action": "create", "type": "task", "title": "{task}", "links": [{"type": "project", "query": "{project_ref}"}]}),
 
-    research_for_project_templates = [
-        ("Research for {project_ref} {topic}", {"action": "create", "type": "research", "title": "{topic}", "links": [{"type": "project", "query": "{project_ref}"}]}),
-        ("Add research for {project_ref} about {topic}", {"action": "create", "type": "research", "title": "{topic}", "links": [{"type": "project", "query": "{project_ref}"}]}),
-        ("Save for {project_ref} research {topic}", {"action": "create", "type": "research", "title": "{topic}", "links": [{"type": "project", "query": "{project_ref}"}]}),
-    ]
+    # Todo patterns
+    ("Todo for {project_ref} {task}", {"action": "create", "type": "task", "title": "{task}", "links": [{"type": "project", "query": "{project_ref}"}]}),
+    ("To do for {project_ref} {task}", {"action": "create", "type": "task", "title": "{task}", "links": [{"type": "project", "query": "{project_ref}"}]}),
+)
 
-    # ==================== IDEA/TASK ENDING WITH "FOR X" ====================
+# ==================== RESEARCH FOR [PROJECT] ====================
 
-    # This pattern: "{content} for {project}"
-    ending_with_for_templates = [
-        ("{topic} idea for {project_ref}", {"action": "create", "type": "idea", "title": "{topic}", "links": [{"type": "project", "query": "{project_ref}"}]}),
-        ("Idea about {topic} for {project_ref}", {"action": "create", "type": "idea", "title": "{topic}", "links": [{"type": "project", "query": "{project_ref}"}]}),
-        ("New idea about {topic} for {project_ref}", {"action": "create", "type": "idea", "title": "{topic}", "links": [{"type": "project", "query": "{project_ref}"}]}),
-        ("Thought about {topic} for {project_ref}", {"action": "create", "type": "idea", "title": "{topic}", "links": [{"type": "project", "query": "{project_ref}"}]}),
-        ("{task} for {project_ref}", {"action": "create", "type": "task", "title": "{task}", "links": [{"type": "project", "query": "{project_ref}"}]}),
-        ("Task {task} for {project_ref}", {"action": "create", "type": "task", "title": "{task}", "links": [{"type": "project", "query": "{project_ref}"}]}),
-    ]
+RESEARCH_FOR_PROJECT_TEMPLATES = (
+    ("Research for {project_ref} {topic}", {"action": "create", "type": "research", "title": "{topic}", "links": [{"type": "project", "query": "{project_ref}"}]}),
+    ("Add research for {project_ref} about {topic}", {"action": "create", "type": "research", "title": "{topic}", "links": [{"type": "project", "query": "{project_ref}"}]}),
+    ("Save for {project_ref} research {topic}", {"action": "create", "type": "research", "title": "{topic}", "links": [{"type": "project", "query": "{project_ref}"}]}),
+)
+
+# ==================== IDEA/TASK ENDING WITH "FOR X" ====================
+
+# This pattern: "{content} for {project}"
+ENDING_WITH_FOR_TEMPLATES = (
+    ("{topic} idea for {project_ref}", {"action": "create", "type": "idea", "title": "{topic}", "links": [{"type": "project", "query": "{project_ref}"}]}),
+    ("Idea about {topic} for {project_ref}", {"action": "create", "type": "idea", "title": "{topic}", "links": [{"type": "project", "query": "{project_ref}"}]}),
+    ("New idea about {topic} for {project_ref}", {"action": "create", "type": "idea", "title": "{topic}", "links": [{"type": "project", "query": "{project_ref}"}]}),
+    ("Thought about {topic} for {project_ref}", {"action": "create", "type": "idea", "title": "{topic}", "links": [{"type": "project", "query": "{project_ref}"}]}),
+    ("{task} for {project_ref}", {"action": "create", "type": "task", "title": "{task}", "links": [{"type": "project", "query": "{project_ref}"}]}),
+    ("Task {task} for {project_ref}", {"action": "create", "type": "task", "title": "{task}", "links": [{"type": "project", "query": "{project_ref}"}]}),
+)
 
+
+@functools.lru_cache(maxsize=None)
+def project_specific_templates():
+    """Compiled project-specific templates, weighted across template kinds.
+
+    Returns (templates, cum_weights) for random.choices.
+    """
     # Combine all templates with appropriate weights
-    all_templates = (
-        idea_for_project_templates * 4 +  # Heavy weight on "idea for X" pattern
-        task_for_project_templates * 3 +
-        research_for_project_templates +
-        ending_with_for_templates * 2
+    return compile_weighted(
+        (IDEA_FOR_PROJECT_TEMPLATES, 4),  # Heavy weight on "idea for X" pattern
+        (TASK_FOR_PROJECT_TEMPLATES, 3),
+        (RESEARCH_FOR_PROJECT_TEMPLATES, 1),
+        (ENDING_WITH_FOR_TEMPLATES, 2),
     )
 
-    for _ in range(n):
-        template, output_template = random.choice(all_templates)
 
-        # Select project reference (person name, company, or generic project)
-        project_ref, ref_type = random.choice(PROJECT_REFERENCES)
-        topic = random.choice(TOPICS)
-        task = random.choice(TASKS)
+# Vocabulary each project-specific placeholder draws from
+PROJECT_SPECIFIC_FIELDS = {"project_ref": PROJECT_REF_NAMES, "topic": TOPICS, "task": TASKS}
 
-        input_text = template.format(project_ref=project_ref, topic=topic, task=task)
 
-        # Deep copy and substitute
-        output_str = json.dumps(output_template)
-        output_str = output_str.replace("{project_ref}", project_ref)
-        output_str = output_str.replace("{topic}", topic)
-        output_str = output_str.replace("{task}", task)
-        output = json.loads(output_str)
+def iter_project_specific_examples(n=2500):
+    """
+    Yield project-specific entity creation examples one at a time.
+    This is CRITICAL for commands like:
+    - "Idea for Michael about user onboarding"
+    - "I just had this thought for Sarah"
+    - "Task for marketing project"
+    - "Add to Acme inbox"
+    """
+    return unique_inputs(_draw_project_specific_examples, n)
 
-        examples.append({"input": input_text, "output": output})
 
-    return examples
+def _draw_project_specific_examples(n):
+    """Yield n candidate examples; inputs may repeat."""
+    # Pick all templates up front, then draw project references (person name,
+    # company, or generic project) and other fields only where they are used
+    templates, cum_weights = project_specific_templates()
+    templates = random.choices(templates, cum_weights=cum_weights, k=n)
+    field_values = sample_values(templates, PROJECT_SPECIFIC_FIELDS)
 
+    for (build_example, _), values in zip(templates, field_values):
+        input_text, output = build_example(**values)
 
-def generate_timed_creation_examples(n=2000):
-    """Generate entity creation examples with time expressions."""
-    examples = []
+        yield {"input": input_text, "output": output}
 
-    # Task with absolute time
-    timed_task_templates = [
-        ("Task {task} at {time}", {"action": "create", "type": "task", "title": "{task}", "metadata": {"startTime": "{time}"}}),
-        ("{task} at {time}", {"action": "create", "type": "task", "title": "{task}", "metadata": {"startTime": "{time}"}}),
-        ("Remind me to {task} at {time}", {"action": "create", "type": "task", "title": "{task}", "metadata": {"startTime": "{time}"}}),
-        ("Schedule {task} for {time}", {"action": "create", "type": "task", "title": "{task}", "metadata": {"startTime": "{time}"}}),
-        ("{task} scheduled for {time}", {"action": "create", "type": "task", "title": "{task}", "metadata": {"startTime": "{time}"}}),
-        ("Put {task} at {time}", {"action": "create", "type": "task", "title": "{task}", "metadata": {"startTime": "{time}"}}),
-    ]
 
-    # Task with relative time
-    relative_task_templates = [
-        ("{task} {relative_time}", {"action": "create", "type": "task", "title": "{task}", "metadata": {"startTime": "{relative_time}"}}),
-        ("Remind me {relative_time} to {task}", {"action": "create", "type": "task", "title": "{task}", "metadata": {"startTime": "{relative_time}"}}),
-        ("Schedule {task} for {relative_time}", {"action": "create", "type": "task", "title": "{task}", "metadata": {"startTime": "{relative_time}"}}),
-        ("{relative_time} {task}", {"action": "create", "type": "task", "title": "{task}", "metadata": {"startTime": "{relative_time}"}}),
-    ]
+def generate_project_specific_examples(n=2500):
+    """List form of iter_project_specific_examples."""
+    return list(iter_project_specific_examples(n))
+
+
+# Task with absolute time
+TIMED_TASK_TEMPLATES = (
+    ("Task {task} at {time}", {"action": "create", "type": "task", "title": "{task}", "metadata": {"startTime": "{time}"}}),
+    ("{task} at {time}", {"action": "create", "type": "task", "title": "{task}", "metadata": {"startTime": "{time}"}}),
+    ("Remind me to {task} at {time}", {"action": "create", "type": "task", "title": "{task}", "metadata": {"startTime": "{time}"}}),
+    ("Schedule {task} for {time}", {"action": "create", "type": "task", "title": "{task}", "metadata": {"startTime": "{time}"}}),
+    ("{task} scheduled for {time}", {"action": "create", "type": "task", "title": "{task}", "metadata": {"startTime": "{time}"}}),
+    ("Put {task} at {time}", {"action": "create", "type": "task", "title": "{task}", "metadata": {"startTime": "{time}"}}),
+)
+
+# Task with relative time
+RELATIVE_TASK_TEMPLATES = (
+    ("{task} {relative_time}", {"action": "create", "type": "task", "title": "{task}", "metadata": {"startTime": "{relative_time}"}}),
+    ("Remind me {relative_time} to {task}", {"action": "create", "type": "task", "title": "{task}", "metadata": {"startTime": "{relative_time}"}}),
+    ("Schedule {task} for {relative_time}", {"action": "create", "type": "task", "title": "{task}", "metadata": {"startTime": "{relative_time}"}}),
+    ("{relative_time} {task}", {"action": "create", "type": "task", "title": "{task}", "metadata": {"startTime": "{relative_time}"}}),
+)
+
+# Schedule block with time range
+BLOCK_RANGE_TEMPLATES = (
+    ("Block {start_time} to {end_time} for {block_name}", {"action": "create", "type": "schedule_block", "title": "{block_name}", "metadata": {"startTime": "{start_time}", "endTime": "{end_time}", "blockType": "focus"}}),
+    ("Deep work from {start_time} to {end_time}", {"action": "create", "type": "schedule_block", "title": "Deep work", "metadata": {"startTime": "{start_time}", "endTime": "{end_time}", "blockType": "focus"}}),
+    ("Focus time {start_time} to {end_time}", {"action": "create", "type": "schedule_block", "title": "Focus time", "metadata": {"startTime": "{start_time}", "endTime": "{end_time}", "blockType": "focus"}}),
+    ("Meeting from {start_time} to {end_time} {block_name}", {"action": "create", "type": "schedule_block", "title": "{block_name}", "metadata": {"startTime": "{start_time}", "endTime": "{end_time}", "blockType": "event"}}),
+    ("{block_name} from {start_time} to {end_time}", {"action": "create", "type": "schedule_block", "title": "{block_name}", "metadata": {"startTime": "{start_time}", "endTime": "{end_time}", "blockType": "task"}}),
+)
+
+# Schedule block with duration
+BLOCK_DURATION_TEMPLATES = (
+    ("Block {duration} for {block_name} at {time}", {"action": "create", "type": "schedule_block", "title": "{block_name}", "metadata": {"startTime": "{time}", "duration": "{duration}", "blockType": "task"}}),
+    ("{duration} of {block_name} at {time}", {"action": "create", "type": "schedule_block", "title": "{block_name}", "metadata": {"startTime": "{time}", "duration": "{duration}", "blockType": "task"}}),
+    ("Schedule {duration} for {block_name}", {"action": "create", "type": "schedule_block", "title": "{block_name}", "metadata": {"duration": "{duration}", "blockType": "task"}}),
+)
+
+# Meeting templates with an absolute time
+MEETING_TEMPLATES = (
+    ("Meeting with {person} at {time}", {"action": "create", "type": "schedule_block", "title": "Meeting with {person}", "metadata": {"startTime": "{time}", "blockType": "event"}}),
+    ("Call with {person} at {time}", {"action": "create", "type": "schedule_block", "title": "Call with {person}", "metadata": {"startTime": "{time}", "blockType": "event"}}),
+    ("1:1 with {person} at {time}", {"action": "create", "type": "schedule_block", "title": "1:1 with {person}", "metadata": {"startTime": "{time}", "blockType": "event"}}),
+)
+
+# Meeting templates with a relative time
+RELATIVE_MEETING_TEMPLATES = (
+    ("Sync with {person} {relative_time}", {"action": "create", "type": "schedule_block", "title": "Sync with {person}", "metadata": {"startTime": "{relative_time}", "blockType": "event"}}),
+)
+
+# Timed task FOR PROJECT
+TIMED_TASK_PROJECT_TEMPLATES = (
+    ("Task for {project_ref} {task} at {time}", {"action": "create", "type": "task", "title": "{task}", "metadata": {"startTime": "{time}"}, "links": [{"type": "project", "query": "{project_ref}"}]}),
+    ("{task} for {project_ref} at {time}", {"action": "create", "type": "task", "title": "{task}", "metadata": {"startTime": "{time}"}, "links": [{"type": "project", "query": "{project_ref}"}]}),
+    ("Remind me for {project_ref} to {task} at {time}", {"action": "create", "type": "task", "title": "{task}", "metadata": {"startTime": "{time}"}, "links": [{"type": "project", "query": "{project_ref}"}]}),
+)
+
+MEETING_PEOPLE = ("John", "Sarah", "Alex", "Mike", "Lisa", "David", "Emily", "Chris", "Rachel", "Tom", "the team", "marketing", "design", "engineering", "product")
+
+BLOCK_NAMES = ("deep work", "focused coding", "writing time", "review session", "planning", "research", "reading", "admin tasks", "emails", "brainstorming")
+
+# Blocks start on the hour from 8am to 3pm; lasting 1-3 hours, they end by 6pm
+FIRST_BLOCK_HOUR, LAST_BLOCK_HOUR = 8, 15
+
+# Block range time labels, indexed by hour
+HOUR_LABELS = tuple(sys.intern(f"{h}{'pm' if h >= 12 else 'am'}") for h in range(24))
+
+# Every (start, end) label pair a block range can take: any start hour, lasting 1-3 hours
+BLOCK_HOUR_RANGES = tuple(
+    (HOUR_LABELS[start], HOUR_LABELS[start + hours])
+    for start in range(FIRST_BLOCK_HOUR, LAST_BLOCK_HOUR + 1)
+    for hours in (1, 2, 3)
+)
+
+
+@functools.lru_cache(maxsize=None)
+def timed_creation_templates():
+    """Compiled timed creation tables, keyed by template kind."""
+    return {
+        "timed_task": compile_templates(TIMED_TASK_TEMPLATES),
+        "relative_task": compile_templates(RELATIVE_TASK_TEMPLATES),
+        "block_range": compile_templates(BLOCK_RANGE_TEMPLATES),
+        "block_duration": compile_templates(BLOCK_DURATION_TEMPLATES),
+        "meeting": compile_templates(MEETING_TEMPLATES),
+        "relative_meeting": compile_templates(RELATIVE_MEETING_TEMPLATES),
+        "timed_project": compile_templates(TIMED_TASK_PROJECT_TEMPLATES),
+    }
 
-    # Schedule block with time range
-    block_range_templates = [
-        ("Block {start_time} to {end_time} for {block_name}", {"action": "create", "type": "schedule_block", "title": "{block_name}", "metadata": {"startTime": "{start_time}", "endTime": "{end_time}", "blockType": "focus"}}),
-        ("Deep work from {start_time} to {end_time}", {"action": "create", "type": "schedule_block", "title": "Deep work", "metadata": {"startTime": "{start_time}", "endTime": "{end_time}", "blockType": "focus"}}),
-        ("Focus time {start_time} to {end_time}", {"action": "create", "type": "schedule_block", "title": "Focus time", "metadata": {"startTime": "{start_time}", "endTime": "{end_time}", "blockType": "focus"}}),
-        ("Meeting from {start_time} to {end_time} {block_name}", {"action": "create", "type": "schedule_block", "title": "{block_name}", "metadata": {"startTime": "{start_time}", "endTime": "{end_time}", "blockType": "event"}}),
-        ("{block_name} from {start_time} to {end_time}", {"action": "create", "type": "schedule_block", "title": "{block_name}", "metadata": {"startTime": "{start_time}", "endTime": "{end_time}", "blockType": "task"}}),
-    ]
 
-    # Schedule block with duration
-    block_duration_templates = [
-        ("Block {duration} for {block_name} at {time}", {"action": "create", "type": "schedule_block", "title": "{block_name}", "metadata": {"startTime": "{time}", "duration": "{duration}", "blockType": "task"}}),
-        ("{duration} of {block_name} at {time}", {"action": "create", "type": "schedule_block", "title": "{block_name}", "metadata": {"startTime": "{time}", "duration": "{duration}", "blockType": "task"}}),
-        ("Schedule {duration} for {block_name}", {"action": "create", "type": "schedule_block", "title": "{block_name}", "metadata": {"duration": "{duration}", "blockType": "task"}}),
-    ]
+# Each timed builder picks one template from its compiled table and the values it needs
+def _build_timed_task(tables):
+    return random.choice(tables["timed_task"]), {
+        "task": random.choice(TASKS),
+        "time": random.choice(TIMES),
+    }
 
-    # Meeting templates
-    meeting_templates = [
-        ("Meeting with {person} at {time}", {"action": "create", "type": "schedule_block", "title": "Meeting with {person}", "metadata": {"startTime": "{time}", "blockType": "event"}}),
-        ("Call with {person} at {time}", {"action": "create", "type": "schedule_block", "title": "Call with {person}", "metadata": {"startTime": "{time}", "blockType": "event"}}),
-        ("1:1 with {person} at {time}", {"action": "create", "type": "schedule_block", "title": "1:1 with {person}", "metadata": {"startTime": "{time}", "blockType": "event"}}),
-        ("Sync with {person} {relative_time}", {"action": "create", "type": "schedule_block", "title": "Sync with {person}", "metadata": {"startTime": "{relative_time}", "blockType": "event"}}),
-    ]
 
-    # Timed task FOR PROJECT
-    timed_task_project_templates = [
-        ("Task for {project_ref} {task} at {time}", {"action": "create", "type": "task", "title": "{task}", "metadata": {"startTime": "{time}"}, "links": [{"type": "project", "query": "{project_ref}"}]}),
-        ("{task} for {project_ref} at {time}", {"action": "create", "type": "task", "title": "{task}", "metadata": {"startTime": "{time}"}, "links": [{"type": "project", "query": "{project_ref}"}]}),
-        ("Remind me for {project_ref} to {task} at {time}", {"action": "create", "type": "task", "title": "{task}", "metadata": {"startTime": "{time}"}, "links": [{"type": "project", "query": "{project_ref}"}]}),
-    ]
+def _build_relative_task(tables):
+    return random.choice(tables["relative_task"]), {
+        "task": random.choice(TASKS),
+        "relative_time": random.choice(RELATIVE_TIMES),
+    }
 
-    people = ["John", "Sarah", "Alex", "Mike", "Lisa", "David", "Emily", "Chris", "Rachel", "Tom", "the team", "marketing", "design", "engineering", "product"]
-
-    block_names = ["deep work", "focused coding", "writing time", "review session", "planning", "research", "reading", "admin tasks", "emails", "brainstorming"]
-
-    hours = list(range(8, 18))  # 8am to 5pm
-
-    for _ in range(n):
-        template_type = random.choice(["timed_task", "relative_task", "block_range", "block_duration", "meeting", "timed_project"])
-
-        if template_type == "timed_task":
-            template, output_template = random.choice(timed_task_templates)
-            task = random.choice(TASKS)
-            time = random.choice(TIMES)
-            input_text = template.format(task=task, time=time)
-            output_str = json.dumps(output_template).replace("{task}", task).replace("{time}", time)
-
-        elif template_type == "relative_task":
-            template, output_template = random.choice(relative_task_templates)
-            task = random.choice(TASKS)
-            relative_time = random.choice(RELATIVE_TIMES)
-            input_text = template.format(task=task, relative_time=relative_time)
-            output_str = json.dumps(output_template).replace("{task}", task).replace("{relative_time}", relative_time)
-
-        elif template_type == "block_range":
-            template, output_template = random.choice(block_range_templates)
-            start_hour = random.choice(hours[:-2])
-            end_hour = start_hour + random.choice([1, 2, 3])
-            start_time = f"{start_hour}{'pm' if start_hour >= 12 else 'am'}"
-            end_time = f"{end_hour}{'pm' if end_hour >= 12 else 'am'}"
-            block_name = random.choice(block_names)
-            input_text = template.format(start_time=start_time, end_time=end_time, block_name=block_name)
-            output_str = json.dumps(output_template).replace("{start_time}", start_time).replace("{end_time}", end_time).replace("{block_name}", block_name)
-
-        elif template_type == "block_duration":
-            template, output_template = random.choice(block_duration_templates)
-            duration, _ = random.choice(DURATIONS)
-            block_name = random.choice(block_names)
-            time = random.choice(TIMES)
-            input_text = template.format(duration=duration, block_name=block_name, time=time)
-            output_str = json.dumps(output_template).replace("{duration}", duration).replace("{block_name}", block_name).replace("{time}", time)
-
-        elif template_type == "timed_project":
-            template, output_template = random.choice(timed_task_project_templates)
-            task = random.choice(TASKS)
-            time = random.choice(TIMES)
-            project_ref, _ = random.choice(PROJECT_REFERENCES)
-            input_text = template.format(task=task, time=time, project_ref=project_ref)
-            output_str = json.dumps(output_template).replace("{task}", task).replace("{time}", time).replace("{project_ref}", project_ref)
-
-        else:  # meeting
-            template, output_template = random.choice(meeting_templates)
-            person = random.choice(people)
-            time = random.choice(TIMES)
-            relative_time = random.choice(RELATIVE_TIMES)
-            input_text = template.format(person=person, time=time, relative_time=relative_time)
-            output_str = json.dumps(output_template).replace("{person}", person).replace("{time}", time).replace("{relative_time}", relative_time)
-
-        output = json.loads(output_str)
-        examples.append({"input": input_text, "output": output})
 
-    return examples
+def _build_block_range(tables):
+    template = random.choice(tables["block_range"])
+    start_time, end_time = random.choice(BLOCK_HOUR_RANGES)
+    return template, {
+        "start_time": start_time,
+        "end_time": end_time,
+        "block_name": random.choice(BLOCK_NAMES),
+    }
 
 
-def generate_modification_examples(n=1500):
-    """Generate entity modification examples."""
-    examples = []
+def _build_block_duration(tables):
+    template = random.choice(tables["block_duration"])
+    duration, _ = random.choice(DURATIONS)
+    return template, {
+        "duration": duration,
+        "block_name": random.choice(BLOCK_NAMES),
+        "time": random.choice(TIMES),
+    }
 
-    # Status changes
-    status_templates = [
-        ("Mark as complete", {"action": "update", "target": "context", "metadata": {"status": "completed"}}),
-        ("Done", {"action": "update", "target": "context", "metadata": {"status": "completed"}}),
-        ("Complete", {"action": "update", "target": "context", "metadata": {"status": "completed"}}),
-        ("Finish this", {"action": "update", "target": "context", "metadata": {"status": "completed"}}),
-        ("Check this off", {"action": "update", "target": "context", "metadata": {"status": "completed"}}),
-        ("I finished this", {"action": "update", "target": "context", "metadata": {"status": "completed"}}),
-        ("That's done", {"action": "update", "target": "context", "metadata": {"status": "completed"}}),
-        ("Mark in progress", {"action": "update", "target": "context", "metadata": {"status": "in_progress"}}),
-        ("Start working on this", {"action": "update", "target": "context", "metadata": {"status": "in_progress"}}),
-        ("Working on it", {"action": "update", "target": "context", "metadata": {"status": "in_progress"}}),
-        ("Reopen this", {"action": "update", "target": "context", "metadata": {"status": "todo"}}),
-        ("Not done yet", {"action": "update", "target": "context", "metadata": {"status": "todo"}}),
-        ("Undo complete", {"action": "update", "target": "context", "metadata": {"status": "todo"}}),
-    ]
 
-    # Time modifications
-    time_templates = [
-        ("Move to {time}", {"action": "update", "target": "context", "metadata": {"startTime": "{time}"}}),
-        ("Reschedule to {time}", {"action": "update", "target": "context", "metadata": {"startTime": "{time}"}}),
-        ("Push to {time}", {"action": "update", "target": "context", "metadata": {"startTime": "{time}"}}),
-        ("Change time to {time}", {"action": "update", "target": "context", "metadata": {"startTime": "{time}"}}),
-        ("Move this to {relative_time}", {"action": "update", "target": "context", "metadata": {"startTime": "{relative_time}"}}),
-        ("Delay to {relative_time}", {"action": "update", "target": "context", "metadata": {"startTime": "{relative_time}"}}),
-        ("Extend to {time}", {"action": "update", "target": "context", "metadata": {"endTime": "{time}"}}),
-        ("End at {time}", {"action": "update", "target": "context", "metadata": {"endTime": "{time}"}}),
-        ("Make it end at {time}", {"action": "update", "target": "context", "metadata": {"endTime": "{time}"}}),
-    ]
-
-    # Priority modifications
-    priority_templates = [
-        ("Make this high priority", {"action": "update", "target": "context", "metadata": {"priority": "high"}}),
-        ("High priority", {"action": "update", "target": "context", "metadata": {"priority": "high"}}),
-        ("This is urgent", {"action": "update", "target": "context", "metadata": {"priority": "high"}}),
-        ("Important", {"action": "update", "target": "context", "metadata": {"priority": "high"}}),
-        ("Lower the priority", {"action": "update", "target": "context", "metadata": {"priority": "low"}}),
-        ("Low priority", {"action": "update", "target": "context", "metadata": {"priority": "low"}}),
-        ("Not that important", {"action": "update", "target": "context", "metadata": {"priority": "low"}}),
-        ("Normal priority", {"action": "update", "target": "context", "metadata": {"priority": "medium"}}),
-        ("Medium priority", {"action": "update", "target": "context", "metadata": {"priority": "medium"}}),
-    ]
+def _build_meeting(tables):
+    # Pick uniformly across both meeting tables, then draw only the time kind it uses
+    absolute, relative = tables["meeting"], tables["relative_meeting"]
+    index = random.randrange(len(absolute) + len(relative))
+    if index < len(absolute):
+        return absolute[index], {"person": random.choice(MEETING_PEOPLE), "time": random.choice(TIMES)}
+    return relative[index - len(absolute)], {
+        "person": random.choice(MEETING_PEOPLE),
+        "relative_time": random.choice(RELATIVE_TIMES),
+    }
 
-    # Project assignment
-    project_templates = [
-        ("Add to {project} project", {"action": "update", "target": "context", "links": [{"type": "project", "query": "{project}"}]}),
-        ("Move to {project}", {"action": "update", "target": "context", "links": [{"type": "project", "query": "{project}"}]}),
-        ("Put this in {project}", {"action": "update", "target": "context", "links": [{"type": "project", "query": "{project}"}]}),
-        ("Assign to {project}", {"action": "update", "target": "context", "links": [{"type": "project", "query": "{project}"}]}),
-        ("This belongs in {project}", {"action": "update", "target": "context", "links": [{"type": "project", "query": "{project}"}]}),
-        # Person-specific project assignment
-        ("Add to {person_name}", {"action": "update", "target": "context", "links": [{"type": "project", "query": "{person_name}"}]}),
-        ("Move to {person_name}", {"action": "update", "target": "context", "links": [{"type": "project", "query": "{person_name}"}]}),
-        ("Put in {person_name} inbox", {"action": "update", "target": "context", "links": [{"type": "project", "query": "{person_name}"}]}),
-        ("Send to {person_name}", {"action": "update", "target": "context", "links": [{"type": "project", "query": "{person_name}"}]}),
-    ]
 
-    # Title/content modifications
-    content_templates = [
-        ("Rename to {task}", {"action": "update", "target": "context", "title": "{task}"}),
-        ("Change title to {task}", {"action": "update", "target": "context", "title": "{task}"}),
-        ("Call it {task} instead", {"action": "update", "target": "context", "title": "{task}"}),
-        ("Actually make it {task}", {"action": "update", "target": "context", "title": "{task}"}),
-    ]
+def _build_timed_project(tables):
+    return random.choice(tables["timed_project"]), {
+        "task": random.choice(TASKS),
+        "time": random.choice(TIMES),
+        "project_ref": random.choice(PROJECT_REF_NAMES),
+    }
 
-    # Delete templates
-    delete_templates = [
-        ("Delete this", {"action": "delete", "target": "context"}),
-        ("Remove this", {"action": "delete", "target": "context"}),
-        ("Delete that", {"action": "delete", "target": "context"}),
-        ("Get rid of this", {"action": "delete", "target": "context"}),
-        ("Remove it", {"action": "delete", "target": "context"}),
-        ("Cancel this", {"action": "delete", "target": "context"}),
-        ("Never mind", {"action": "delete", "target": "context"}),
-    ]
 
-    all_templates = (
-        status_templates * 3 +
-        time_templates * 2 +
-        priority_templates * 2 +
-        project_templates * 3 +  # Increased weight for project assignment
-        content_templates +
-        delete_templates * 2
-    )
+# Template kinds are drawn uniformly
+TIMED_BUILDERS = (
+    _build_timed_task,
+    _build_relative_task,
+    _build_block_range,
+    _build_block_duration,
+    _build_meeting,
+    _build_timed_project,
+)
 
-    for _ in range(n):
-        template, output_template = random.choice(all_templates)
-        time = random.choice(TIMES)
-        relative_time = random.choice(RELATIVE_TIMES)
-        project = random.choice(PROJECTS)
-        person_name = random.choice(PERSON_NAMES)
-        task = random.choice(TASKS)
-
-        input_text = template.format(time=time, relative_time=relative_time, project=project, task=task, person_name=person_name)
-        output_str = json.dumps(output_template)
-        output_str = output_str.replace("{time}", time)
-        output_str = output_str.replace("{relative_time}", relative_time)
-        output_str = output_str.replace("{project}", project)
-        output_str = output_str.replace("{person_name}", person_name)
-        output_str = output_str.replace("{task}", task)
-        output = json.loads(output_str)
-
-        examples.append({"input": input_text, "output": output})
 
-    return examples
+def iter_timed_creation_examples(n=2000):
+    """Yield entity creation examples with time expressions."""
+    return unique_inputs(_draw_timed_creation_examples, n)
 
 
-def generate_search_examples(n=1500):
-    """Generate search and retrieval examples."""
-    examples = []
+def _draw_timed_creation_examples(n):
+    """Yield n candidate examples; inputs may repeat."""
+    tables = timed_creation_templates()
+    for builder in random.choices(TIMED_BUILDERS, k=n):
+        (build_example, fields), values = builder(tables)
+        input_text, output = build_example(*[values[field] for field in fields])
+        yield {"input": input_text, "output": output}
 
-    # Type-filtered search
-    type_search_templates = [
-        ("Find ideas about {query}", {"action": "search", "type": "idea", "query": "{query}"}),
-        ("Show ideas about {query}", {"action": "search", "type": "idea", "query": "{query}"}),
-        ("Search ideas for {query}", {"action": "search", "type": "idea", "query": "{query}"}),
-        ("What ideas do I have about {query}", {"action": "search", "type": "idea", "query": "{query}"}),
-        ("Find tasks about {query}", {"action": "search", "type": "task", "query": "{query}"}),
-        ("Show tasks for {query}", {"action": "search", "type": "task", "query": "{query}"}),
-        ("What tasks are related to {query}", {"action": "search", "type": "task", "query": "{query}"}),
-        ("Find research on {query}", {"action": "search", "type": "research", "query": "{query}"}),
-        ("Show me research about {query}", {"action": "search", "type": "research", "query": "{query}"}),
-        ("What research do I have on {query}", {"action": "search", "type": "research", "query": "{query}"}),
-        # Notes
-        ("Find notes about {query}", {"action": "search", "type": "note", "query": "{query}"}),
-        ("Show notes about {query}", {"action": "search", "type": "note", "query": "{query}"}),
-        ("Search notes for {query}", {"action": "search", "type": "note", "query": "{query}"}),
-        ("What notes do I have about {query}", {"action": "search", "type": "note", "query": "{query}"}),
-        # Thinkspaces
-        ("Find thinkspaces about {query}", {"action": "search", "type": "thinkspace", "query": "{query}"}),
-        ("Show thinkspaces for {query}", {"action": "search", "type": "thinkspace", "query": "{query}"}),
-        ("What canvases do I have about {query}", {"action": "search", "type": "thinkspace", "query": "{query}"}),
-        # Connections
-        ("Find connections about {query}", {"action": "search", "type": "connection", "query": "{query}"}),
-        ("Show connections for {query}", {"action": "search", "type": "connection", "query": "{query}"}),
-        ("What mental models do I have about {query}", {"action": "search", "type": "connection", "query": "{query}"}),
-    ]
 
-    # General search
-    general_search_templates = [
-        ("Search for {query}", {"action": "search", "query": "{query}"}),
-        ("Find {query}", {"action": "search", "query": "{query}"}),
-        ("Look for {query}", {"action": "search", "query": "{query}"}),
-        ("What do I have about {query}", {"action": "search", "query": "{query}"}),
-        ("Search {query}", {"action": "search", "query": "{query}"}),
-        ("Find anything about {query}", {"action": "search", "query": "{query}"}),
-    ]
+def generate_timed_creation_examples(n=2000):
+    """List form of iter_timed_creation_examples."""
+    return list(iter_timed_creation_examples(n))
+
+
+# Status changes
+STATUS_UPDATE_TEMPLATES = (
+    ("Mark as complete", {"action": "update", "target": "context", "metadata": {"status": "completed"}}),
+    ("Done", {"action": "update", "target": "context", "metadata": {"status": "completed"}}),
+    ("Complete", {"action": "update", "target": "context", "metadata": {"status": "completed"}}),
+    ("Finish this", {"action": "update", "target": "context", "metadata": {"status": "completed"}}),
+    ("Check this off", {"action": "update", "target": "context", "metadata": {"status": "completed"}}),
+    ("I finished this", {"action": "update", "target": "context", "metadata": {"status": "completed"}}),
+    ("That's done", {"action": "update", "target": "context", "metadata": {"status": "completed"}}),
+    ("Mark in progress", {"action": "update", "target": "context", "metadata": {"status": "in_progress"}}),
+    ("Start working on this", {"action": "update", "target": "context", "metadata": {"status": "in_progress"}}),
+    ("Working on it", {"action": "update", "target": "context", "metadata": {"status": "in_progress"}}),
+    ("Reopen this", {"action": "update", "target": "context", "metadata": {"status": "todo"}}),
+    ("Not done yet", {"action": "update", "target": "context", "metadata": {"status": "todo"}}),
+    ("Undo complete", {"action": "update", "target": "context", "metadata": {"status": "todo"}}),
+)
+
+# Time modifications
+TIME_UPDATE_TEMPLATES = (
+    ("Move to {time}", {"action": "update", "target": "context", "metadata": {"startTime": "{time}"}}),
+    ("Reschedule to {time}", {"action": "update", "target": "context", "metadata": {"startTime": "{time}"}}),
+    ("Push to {time}", {"action": "update", "target": "context", "metadata": {"startTime": "{time}"}}),
+    ("Change time to {time}", {"action": "update", "target": "context", "metadata": {"startTime": "{time}"}}),
+    ("Move this to {relative_time}", {"action": "update", "target": "context", "metadata": {"startTime": "{relative_time}"}}),
+    ("Delay to {relative_time}", {"action": "update", "target": "context", "metadata": {"startTime": "{relative_time}"}}),
+    ("Extend to {time}", {"action": "update", "target": "context", "metadata": {"endTime": "{time}"}}),
+    ("End at {time}", {"action": "update", "target": "context", "metadata": {"endTime": "{time}"}}),
+    ("Make it end at {time}", {"action": "update", "target": "context", "metadata": {"endTime": "{time}"}}),
+)
+
+# Priority modifications
+PRIORITY_UPDATE_TEMPLATES = (
+    ("Make this high priority", {"action": "update", "target": "context", "metadata": {"priority": "high"}}),
+    ("High priority", {"action": "update", "target": "context", "metadata": {"priority": "high"}}),
+    ("This is urgent", {"action": "update", "target": "context", "metadata": {"priority": "high"}}),
+    ("Important", {"action": "update", "target": "context", "metadata": {"priority": "high"}}),
+    ("Lower the priority", {"action": "update", "target": "context", "metadata": {"priority": "low"}}),
+    ("Low priority", {"action": "update", "target": "context", "metadata": {"priority": "low"}}),
+    ("Not that important", {"action": "update", "target": "context", "metadata": {"priority": "low"}}),
+    ("Normal priority", {"action": "update", "target": "context", "metadata": {"priority": "medium"}}),
+    ("Medium priority", {"action": "update", "target": "context", "metadata": {"priority": "medium"}}),
+)
+
+# Project assignment
+PROJECT_UPDATE_TEMPLATES = (
+    ("Add to {project} project", {"action": "update", "target": "context", "links": [{"type": "project", "query": "{project}"}]}),
+    ("Move to {project}", {"action": "update", "target": "context", "links": [{"type": "project", "query": "{project}"}]}),
+    ("Put this in {project}", {"action": "update", "target": "context", "links": [{"type": "project", "query": "{project}"}]}),
+    ("Assign to {project}", {"action": "update", "target": "context", "links": [{"type": "project", "query": "{project}"}]}),
+    ("This belongs in {project}", {"action": "update", "target": "context", "links": [{"type": "project", "query": "{project}"}]}),
+    # Person-specific project assignment
+    ("Add to {person_name}", {"action": "update", "target": "context", "links": [{"type": "project", "query": "{person_name}"}]}),
+    ("Move to {person_name}", {"action": "update", "target": "context", "links": [{"type": "project", "query": "{person_name}"}]}),
+    ("Put in {person_name} inbox", {"action": "update", "target": "context", "links": [{"type": "project", "query": "{person_name}"}]}),
+    ("Send to {person_name}", {"action": "update", "target": "context", "links": [{"type": "project", "query": "{person_name}"}]}),
+)
+
+# Title/content modifications
+CONTENT_UPDATE_TEMPLATES = (
+    ("Rename to {task}", {"action": "update", "target": "context", "title": "{task}"}),
+    ("Change title to {task}", {"action": "update", "target": "context", "title": "{task}"}),
+    ("Call it {task} instead", {"action": "update", "target": "context", "title": "{task}"}),
+    ("Actually make it {task}", {"action": "update", "target": "context", "title": "{task}"}),
+)
+
+# Delete templates
+DELETE_TEMPLATES = (
+    ("Delete this", {"action": "delete", "target": "context"}),
+    ("Remove this", {"action": "delete", "target": "context"}),
+    ("Delete that", {"action": "delete", "target": "context"}),
+    ("Get rid of this", {"action": "delete", "target": "context"}),
+    ("Remove it", {"action": "delete", "target": "context"}),
+    ("Cancel this", {"action": "delete", "target": "context"}),
+    ("Never mind", {"action": "delete", "target": "context"}),
+)
+
+
+# Vocabulary each modification placeholder draws from
+MODIFICATION_FIELDS = {
+    "time": TIMES,
+    "relative_time": RELATIVE_TIMES,
+    "project": PROJECTS,
+    "person_name": PERSON_NAMES,
+    "task": TASKS,
+}
 
-    # Time-filtered search
-    time_search_templates = [
-        ("What tasks are due today", {"action": "search", "type": "task", "filter": {"dueDate": "today"}}),
-        ("Show me today's tasks", {"action": "search", "type": "task", "filter": {"dueDate": "today"}}),
-        ("What's due this week", {"action": "search", "type": "task", "filter": {"dueDate": "this week"}}),
-        ("Tasks for tomorrow", {"action": "search", "type": "task", "filter": {"dueDate": "tomorrow"}}),
-        ("What do I have scheduled today", {"action": "search", "type": "schedule_block", "filter": {"date": "today"}}),
-        ("Show my schedule for tomorrow", {"action": "search", "type": "schedule_block", "filter": {"date": "tomorrow"}}),
-    ]
 
-    # Status-filtered search
-    status_search_templates = [
-        ("Show completed tasks", {"action": "search", "type": "task", "filter": {"status": "completed"}}),
-        ("What have I finished", {"action": "search", "type": "task", "filter": {"status": "completed"}}),
-        ("Show open tasks", {"action": "search", "type": "task", "filter": {"status": "todo"}}),
-        ("What's left to do", {"action": "search", "type": "task", "filter": {"status": "todo"}}),
-        ("Tasks in progress", {"action": "search", "type": "task", "filter": {"status": "in_progress"}}),
-        ("What am I working on", {"action": "search", "type": "task", "filter": {"status": "in_progress"}}),
-    ]
+@functools.lru_cache(maxsize=None)
+def modification_templates():
+    """Compiled modification templates, weighted across template kinds.
 
-    # Project-filtered search
-    project_search_templates = [
-        ("Show tasks in {project}", {"action": "search", "type": "task", "filter": {"project": "{project}"}}),
-        ("What's in {project} project", {"action": "search", "filter": {"project": "{project}"}}),
-        ("Ideas for {project}", {"action": "search", "type": "idea", "filter": {"project": "{project}"}}),
-        ("Everything in {project}", {"action": "search", "filter": {"project": "{project}"}}),
-        # Person-specific project search
-        ("Show ideas for {person_name}", {"action": "search", "type": "idea", "filter": {"project": "{person_name}"}}),
-        ("What's in {person_name}", {"action": "search", "filter": {"project": "{person_name}"}}),
-        ("Tasks for {person_name}", {"action": "search", "type": "task", "filter": {"project": "{person_name}"}}),
-        ("{person_name} inbox", {"action": "search", "filter": {"project": "{person_name}"}}),
-        ("Show {person_name} project", {"action": "search", "filter": {"project": "{person_name}"}}),
-    ]
+    Returns (templates, cum_weights) for random.choices.
+    """
+    return compile_weighted(
+        (STATUS_UPDATE_TEMPLATES, 3),
+        (TIME_UPDATE_TEMPLATES, 2),
+        (PRIORITY_UPDATE_TEMPLATES, 2),
+        (PROJECT_UPDATE_TEMPLATES, 3),  # Increased weight for project assignment
+        (CONTENT_UPDATE_TEMPLATES, 1),
+        (DELETE_TEMPLATES, 2),
+    )
 
-    # Semantic search
-    semantic_templates = [
-        ("What's relevant to this", {"action": "search", "target": "context", "mode": "semantic"}),
-        ("Find related items", {"action": "search", "target": "context", "mode": "semantic"}),
-        ("Show similar things", {"action": "search", "target": "context", "mode": "semantic"}),
-        ("What connects to this", {"action": "search", "target": "context", "mode": "semantic"}),
-    ]
 
-    # Navigation (special type of search)
-    navigation_templates = [
-        ("Open projects", {"action": "navigate", "destination": "projects"}),
-        ("Go to ideas", {"action": "navigate", "destination": "ideas"}),
-        ("Show me tasks", {"action": "navigate", "destination": "tasks"}),
-        ("Open today", {"action": "navigate", "destination": "today"}),
-        ("Go to schedule", {"action": "navigate", "destination": "schedule"}),
-        ("Show research", {"action": "navigate", "destination": "research"}),
-        ("Open settings", {"action": "navigate", "destination": "settings"}),
-        ("Go home", {"action": "navigate", "destination": "home"}),
-        # NEW: Modern navigation destinations
-        ("Open plannerum", {"action": "navigate", "destination": "plannerum"}),
-        ("Go to planner", {"action": "navigate", "destination": "plannerum"}),
-        ("Show planner", {"action": "navigate", "destination": "plannerum"}),
-        ("Open thinkspace", {"action": "navigate", "destination": "thinkspace"}),
-        ("Go to canvas", {"action": "navigate", "destination": "thinkspace"}),
-        ("Show canvas", {"action": "navigate", "destination": "thinkspace"}),
-        ("Open inbox", {"action": "navigate", "destination": "inbox"}),
-        ("Go to inbox", {"action": "navigate", "destination": "inbox"}),
-        ("Open notes", {"action": "navigate", "destination": "notes"}),
-        ("Go to notes", {"action": "navigate", "destination": "notes"}),
-    ]
+def iter_modification_examples(n=1500):
+    """Yield entity modification examples."""
+    # Pick all templates up front, then draw only the fields they use
+    templates, cum_weights = modification_templates()
+    templates = random.choices(templates, cum_weights=cum_weights, k=n)
+    field_values = sample_values(templates, MODIFICATION_FIELDS)
 
-    all_templates = (
-        type_search_templates * 3 +
-        general_search_templates * 3 +
-        time_search_templates * 2 +
-        status_search_templates * 2 +
-        project_search_templates * 3 +  # Increased weight
-        semantic_templates +
-        navigation_templates * 2
-    )
+    for template, values in zip(templates, field_values):
+        input_text, output = render_cached(template, tuple(values.values()))
 
-    search_queries = TOPICS + list(set([t.split()[-1] for t in TASKS]))  # Topics + last word of tasks
+        yield {"input": input_text, "output": output}
 
-    for _ in range(n):
-        template, output_template = random.choice(all_templates)
-        query = random.choice(search_queries)
-        project = random.choice(PROJECTS)
-        person_name = random.choice(PERSON_NAMES)
 
-        input_text = template.format(query=query, project=project, person_name=person_name)
-        output_str = json.dumps(output_template)
-        output_str = output_str.replace("{query}", query)
-        output_str = output_str.replace("{project}", project)
-        output_str = output_str.replace("{person_name}", person_name)
-        output = json.loads(output_str)
+def generate_modification_examples(n=1500):
+    """List form of iter_modification_examples."""
+    return list(iter_modification_examples(n))
+
+
+# Type-filtered search
+TYPE_SEARCH_TEMPLATES = (
+    ("Find ideas about {query}", {"action": "search", "type": "idea", "query": "{query}"}),
+    ("Show ideas about {query}", {"action": "search", "type": "idea", "query": "{query}"}),
+    ("Search ideas for {query}", {"action": "search", "type": "idea", "query": "{query}"}),
+    ("What ideas do I have about {query}", {"action": "search", "type": "idea", "query": "{query}"}),
+    ("Find tasks about {query}", {"action": "search", "type": "task", "query": "{query}"}),
+    ("Show tasks for {query}", {"action": "search", "type": "task", "query": "{query}"}),
+    ("What tasks are related to {query}", {"action": "search", "type": "task", "query": "{query}"}),
+    ("Find research on {query}", {"action": "search", "type": "research", "query": "{query}"}),
+    ("Show me research about {query}", {"action": "search", "type": "research", "query": "{query}"}),
+    ("What research do I have on {query}", {"action": "search", "type": "research", "query": "{query}"}),
+    # Notes
+    ("Find notes about {query}", {"action": "search", "type": "note", "query": "{query}"}),
+    ("Show notes about {query}", {"action": "search", "type": "note", "query": "{query}"}),
+    ("Search notes for {query}", {"action": "search", "type": "note", "query": "{query}"}),
+    ("What notes do I have about {query}", {"action": "search", "type": "note", "query": "{query}"}),
+    # Thinkspaces
+    ("Find thinkspaces about {query}", {"action": "search", "type": "thinkspace", "query": "{query}"}),
+    ("Show thinkspaces for {query}", {"action": "search", "type": "thinkspace", "query": "{query}"}),
+    ("What canvases do I have about {query}", {"action": "search", "type": "thinkspace", "query": "{query}"}),
+    # Connections
+    ("Find connections about {query}", {"action": "search", "type": "connection", "query": "{query}"}),
+    ("Show connections for {query}", {"action": "search", "type": "connection", "query": "{query}"}),
+    ("What mental models do I have about {query}", {"action": "search", "type": "connection", "query": "{query}"}),
+)
+
+# General search
+GENERAL_SEARCH_TEMPLATES = (
+    ("Search for {query}", {"action": "search", "query": "{query}"}),
+    ("Find {query}", {"action": "search", "query": "{query}"}),
+    ("Look for {query}", {"action": "search", "query": "{query}"}),
+    ("What do I have about {query}", {"action": "search", "query": "{query}"}),
+    ("Search {query}", {"action": "search", "query": "{query}"}),
+    ("Find anything about {query}", {"action": "search", "query": "{query}"}),
+)
+
+# Time-filtered search
+TIME_SEARCH_TEMPLATES = (
+    ("What tasks are due today", {"action": "search", "type": "task", "filter": {"dueDate": "today"}}),
+    ("Show me today's tasks", {"action": "search", "type": "task", "filter": {"dueDate": "today"}}),
+    ("What's due this week", {"action": "search", "type": "task", "filter": {"dueDate": "this week"}}),
+    ("Tasks for tomorrow", {"action": "search", "type": "task", "filter": {"dueDate": "tomorrow"}}),
+    ("What do I have scheduled today", {"action": "search", "type": "schedule_block", "filter": {"date": "today"}}),
+    ("Show my schedule for tomorrow", {"action": "search", "type": "schedule_block", "filter": {"date": "tomorrow"}}),
+)
+
+# Status-filtered search
+STATUS_SEARCH_TEMPLATES = (
+    ("Show completed tasks", {"action": "search", "type": "task", "filter": {"status": "completed"}}),
+    ("What have I finished", {"action": "search", "type": "task", "filter": {"status": "completed"}}),
+    ("Show open tasks", {"action": "search", "type": "task", "filter": {"status": "todo"}}),
+    ("What's left to do", {"action": "search", "type": "task", "filter": {"status": "todo"}}),
+    ("Tasks in progress", {"action": "search", "type": "task", "filter": {"status": "in_progress"}}),
+    ("What am I working on", {"action": "search", "type": "task", "filter": {"status": "in_progress"}}),
+)
+
+# Project-filtered search
+PROJECT_SEARCH_TEMPLATES = (
+    ("Show tasks in {project}", {"action": "search", "type": "task", "filter": {"project": "{project}"}}),
+    ("What's in {project} project", {"action": "search", "filter": {"project": "{project}"}}),
+    ("Ideas for {project}", {"action": "search", "type": "idea", "filter": {"project": "{project}"}}),
+    ("Everything in {project}", {"action": "search", "filter": {"project": "{project}"}}),
+    # Person-specific project search
+    ("Show ideas for {person_name}", {"action": "search", "type": "idea", "filter": {"project": "{person_name}"}}),
+    ("What's in {person_name}", {"action": "search", "filter": {"project": "{person_name}"}}),
+    ("Tasks for {person_name}", {"action": "search", "type": "task", "filter": {"project": "{person_name}"}}),
+    ("{person_name} inbox", {"action": "search", "filter": {"project": "{person_name}"}}),
+    ("Show {person_name} project", {"action": "search", "filter": {"project": "{person_name}"}}),
+)
+
+# Semantic search
+SEMANTIC_SEARCH_TEMPLATES = (
+    ("What's relevant to this", {"action": "search", "target": "context", "mode": "semantic"}),
+    ("Find related items", {"action": "search", "target": "context", "mode": "semantic"}),
+    ("Show similar things", {"action": "search", "target": "context", "mode": "semantic"}),
+    ("What connects to this", {"action": "search", "target": "context", "mode": "semantic"}),
+)
+
+# Navigation (special type of search)
+NAVIGATION_SEARCH_TEMPLATES = (
+    ("Open projects", {"action": "navigate", "destination": "projects"}),
+    ("Go to ideas", {"action": "navigate", "destination": "ideas"}),
+    ("Show me tasks", {"action": "navigate", "destination": "tasks"}),
+    ("Open today", {"action": "navigate", "destination": "today"}),
+    ("Go to schedule", {"action": "navigate", "destination": "schedule"}),
+    ("Show research", {"action": "navigate", "destination": "research"}),
+    ("Open settings", {"action": "navigate", "destination": "settings"}),
+    ("Go home", {"action": "navigate", "destination": "home"}),
+    # NEW: Modern navigation destinations
+    ("Open plannerum", {"action": "navigate", "destination": "plannerum"}),
+    ("Go to planner", {"action": "navigate", "destination": "plannerum"}),
+    ("Show planner", {"action": "navigate", "destination": "plannerum"}),
+    ("Open thinkspace", {"action": "navigate", "destination": "thinkspace"}),
+    ("Go to canvas", {"action": "navigate", "destination": "thinkspace"}),
+    ("Show canvas", {"action": "navigate", "destination": "thinkspace"}),
+    ("Open inbox", {"action": "navigate", "destination": "inbox"}),
+    ("Go to inbox", {"action": "navigate", "destination": "inbox"}),
+    ("Open notes", {"action": "navigate", "destination": "notes"}),
+    ("Go to notes", {"action": "navigate", "destination": "notes"}),
+)
+
+
+# Topics + last word of tasks; dict.fromkeys keeps a stable order where a set
+# would vary with string hashing, and interning shares each repeated word
+SEARCH_QUERIES = TOPICS + tuple(dict.fromkeys(sys.intern(t.split()[-1]) for t in TASKS))
+
+# Vocabulary each search placeholder draws from
+SEARCH_FIELDS = {"query": SEARCH_QUERIES, "project": PROJECTS, "person_name": PERSON_NAMES}
+
+
+@functools.lru_cache(maxsize=None)
+def search_templates():
+    """Compiled search templates, weighted across template kinds.
+
+    Returns (templates, cum_weights) for random.choices.
+    """
+    return compile_weighted(
+        (TYPE_SEARCH_TEMPLATES, 3),
+        (GENERAL_SEARCH_TEMPLATES, 3),
+        (TIME_SEARCH_TEMPLATES, 2),
+        (STATUS_SEARCH_TEMPLATES, 2),
+        (PROJECT_SEARCH_TEMPLATES, 3),  # Increased weight
+        (SEMANTIC_SEARCH_TEMPLATES, 1),
+        (NAVIGATION_SEARCH_TEMPLATES, 2),
+    )
 
-        examples.append({"input": input_text, "output": output})
 
-    return examples
+def iter_search_examples(n=1500):
+    """Yield search and retrieval examples."""
+    # Pick all templates up front, then draw only the fields they use
+    templates, cum_weights = search_templates()
+    templates = random.choices(templates, cum_weights=cum_weights, k=n)
+    field_values = sample_values(templates, SEARCH_FIELDS)
 
+    for template, values in zip(templates, field_values):
+        input_text, output = render_cached(template, tuple(values.values()))
 
-def generate_batch_examples(n=1000):
-    """Generate multi-entity / brain dump examples."""
-    examples = []
+        yield {"input": input_text, "output": output}
 
-    # Two-item batches
-    two_item_templates = [
-        ("I need to {task1} and {task2}", {"action": "batch", "items": [{"type": "task", "title": "{task1}"}, {"type": "task", "title": "{task2}"}]}),
-        ("{task1} and {task2}", {"action": "batch", "items": [{"type": "task", "title": "{task1}"}, {"type": "task", "title": "{task2}"}]}),
-        ("Create tasks {task1} and {task2}", {"action": "batch", "items": [{"type": "task", "title": "{task1}"}, {"type": "task", "title": "{task2}"}]}),
-        ("Add {task1} and also {task2}", {"action": "batch", "items": [{"type": "task", "title": "{task1}"}, {"type": "task", "title": "{task2}"}]}),
-    ]
 
-    # Three-item batches
-    three_item_templates = [
-        ("I need to {task1}, {task2}, and {task3}", {"action": "batch", "items": [{"type": "task", "title": "{task1}"}, {"type": "task", "title": "{task2}"}, {"type": "task", "title": "{task3}"}]}),
-        ("{task1}, {task2}, and {task3}", {"action": "batch", "items": [{"type": "task", "title": "{task1}"}, {"type": "task", "title": "{task2}"}, {"type": "task", "title": "{task3}"}]}),
-        ("Create tasks for {task1}, {task2}, and {task3}", {"action": "batch", "items": [{"type": "task", "title": "{task1}"}, {"type": "task", "title": "{task2}"}, {"type": "task", "title": "{task3}"}]}),
-        ("Add to my list {task1}, {task2}, {task3}", {"action": "batch", "items": [{"type": "task", "title": "{task1}"}, {"type": "task", "title": "{task2}"}, {"type": "task", "title": "{task3}"}]}),
-    ]
+def generate_search_examples(n=1500):
+    """List form of iter_search_examples."""
+    return list(iter_search_examples(n))
+
+
+# Two-item batches
+TWO_ITEM_TEMPLATES = (
+    ("I need to {task1} and {task2}", {"action": "batch", "items": [{"type": "task", "title": "{task1}"}, {"type": "task", "title": "{task2}"}]}),
+    ("{task1} and {task2}", {"action": "batch", "items": [{"type": "task", "title": "{task1}"}, {"type": "task", "title": "{task2}"}]}),
+    ("Create tasks {task1} and {task2}", {"action": "batch", "items": [{"type": "task", "title": "{task1}"}, {"type": "task", "title": "{task2}"}]}),
+    ("Add {task1} and also {task2}", {"action": "batch", "items": [{"type": "task", "title": "{task1}"}, {"type": "task", "title": "{task2}"}]}),
+)
+
+# Three-item batches
+THREE_ITEM_TEMPLATES = (
+    ("I need to {task1}, {task2}, and {task3}", {"action": "batch", "items": [{"type": "task", "title": "{task1}"}, {"type": "task", "title": "{task2}"}, {"type": "task", "title": "{task3}"}]}),
+    ("{task1}, {task2}, and {task3}", {"action": "batch", "items": [{"type": "task", "title": "{task1}"}, {"type": "task", "title": "{task2}"}, {"type": "task", "title": "{task3}"}]}),
+    ("Create tasks for {task1}, {task2}, and {task3}", {"action": "batch", "items": [{"type": "task", "title": "{task1}"}, {"type": "task", "title": "{task2}"}, {"type": "task", "title": "{task3}"}]}),
+    ("Add to my list {task1}, {task2}, {task3}", {"action": "batch", "items": [{"type": "task", "title": "{task1}"}, {"type": "task", "title": "{task2}"}, {"type": "task", "title": "{task3}"}]}),
+)
+
+# Mixed type batches
+MIXED_BATCH_TEMPLATES = (
+    ("Idea about {topic} and task to {task1}", {"action": "batch", "items": [{"type": "idea", "title": "{topic}"}, {"type": "task", "title": "{task1}"}]}),
+    ("Note about {topic} and remind me to {task1}", {"action": "batch", "items": [{"type": "idea", "title": "{topic}"}, {"type": "task", "title": "{task1}"}]}),
+)
+
+# Batch FOR PROJECT
+BATCH_PROJECT_TEMPLATES = (
+    ("For {project_ref} {task1} and {task2}", {"action": "batch", "items": [{"type": "task", "title": "{task1}", "links": [{"type": "project", "query": "{project_ref}"}]}, {"type": "task", "title": "{task2}", "links": [{"type": "project", "query": "{project_ref}"}]}]}),
+    ("Add to {project_ref} {task1} and {task2}", {"action": "batch", "items": [{"type": "task", "title": "{task1}", "links": [{"type": "project", "query": "{project_ref}"}]}, {"type": "task", "title": "{task2}", "links": [{"type": "project", "query": "{project_ref}"}]}]}),
+)
+
+
+@functools.lru_cache(maxsize=None)
+def batch_templates():
+    """Compiled multi-entity templates, weighted across template kinds.
+
+    Returns (templates, cum_weights) for random.choices.
+    """
+    return compile_weighted(
+        (TWO_ITEM_TEMPLATES, 3),
+        (THREE_ITEM_TEMPLATES, 2),
+        (MIXED_BATCH_TEMPLATES, 1),
+        (BATCH_PROJECT_TEMPLATES, 2),
+    )
 
-    # Mixed type batches
-    mixed_templates = [
-        ("Idea about {topic} and task to {task1}", {"action": "batch", "items": [{"type": "idea", "title": "{topic}"}, {"type": "task", "title": "{task1}"}]}),
-        ("Note about {topic} and remind me to {task1}", {"action": "batch", "items": [{"type": "idea", "title": "{topic}"}, {"type": "task", "title": "{task1}"}]}),
-    ]
 
-    # Batch FOR PROJECT
-    batch_project_templates = [
-        ("For {project_ref} {task1} and {task2}", {"action": "batch", "items": [{"type": "task", "title": "{task1}", "links": [{"type": "project", "query": "{project_ref}"}]}, {"type": "task", "title": "{task2}", "links": [{"type": "project", "query": "{project_ref}"}]}]}),
-        ("Add to {project_ref} {task1} and {task2}", {"action": "batch", "items": [{"type": "task", "title": "{task1}", "links": [{"type": "project", "query": "{project_ref}"}]}, {"type": "task", "title": "{task2}", "links": [{"type": "project", "query": "{project_ref}"}]}]}),
-    ]
+def iter_batch_examples(n=1000):
+    """Yield multi-entity / brain dump examples."""
+    # Draw templates, project references and topics in one call each; the
+    # three task titles must be distinct, so they keep a per-example sample
+    templates, cum_weights = batch_templates()
+    templates = random.choices(templates, cum_weights=cum_weights, k=n)
+    project_refs = random.choices(PROJECT_REF_NAMES, k=n)
+    topics = random.choices(TOPICS, k=n)
 
-    all_templates = two_item_templates * 3 + three_item_templates * 2 + mixed_templates + batch_project_templates * 2
+    for (build_example, fields), project_ref, topic in zip(templates, project_refs, topics):
+        task1, task2, task3 = random.sample(TASKS, 3)
 
-    for _ in range(n):
-        template, output_template = random.choice(all_templates)
-        tasks = random.sample(TASKS, 3)
-        topic = random.choice(TOPICS)
-        project_ref, _ = random.choice(PROJECT_REFERENCES)
+        values = {"task1": task1, "task2": task2, "task3": task3, "topic": topic, "project_ref": project_ref}
+        input_text, output = build_example(*[values[field] for field in fields])
 
-        input_text = template.format(
-            task1=tasks[0],
-            task2=tasks[1],
-            task3=tasks[2] if "{task3}" in template else "",
-            topic=topic,
-            project_ref=project_ref
-        )
-        output_str = json.dumps(output_template)
-        output_str = output_str.replace("{task1}", tasks[0])
-        output_str = output_str.replace("{task2}", tasks[1])
-        output_str = output_str.replace("{task3}", tasks[2])
-        output_str = output_str.replace("{topic}", topic)
-        output_str = output_str.replace("{project_ref}", project_ref)
-        output = json.loads(output_str)
+        yield {"input": input_text, "output": output}
 
-        examples.append({"input": input_text, "output": output})
 
-    return examples
+def generate_batch_examples(n=1000):
+    """List form of iter_batch_examples."""
+    return list(iter_batch_examples(n))
 
 
 # ============================================================================
@@ -947,432 +1267,520 @@ def generate_batch_examples(n=1000):
 # ============================================================================
 
 # Level System Query Types
-LEVEL_QUERY_TYPES = [
-    ("levelStatus", ["What's my level", "What level am I", "Show my level", "Level status", "My current level"]),
-    ("xpToday", ["How much XP today", "XP earned today", "Today's XP", "Show XP today", "What XP did I get"]),
-    ("xpBreakdown", ["XP breakdown", "Show XP by dimension", "Break down my XP", "XP details"]),
-    ("dimensionStatus", ["How's my cognitive dimension", "Show creative status", "What's my physiological progress", "Knowledge dimension status"]),
-    ("streakStatus", ["What's my streak", "How long is my streak", "Current streak", "Show my streak", "Am I on a streak"]),
-    ("allStreaks", ["Show all streaks", "What streaks do I have", "All my streaks", "Streak summary"]),
-    ("badgesEarned", ["What badges have I earned", "Show my badges", "My achievements", "Badges unlocked", "Show achievements"]),
-    ("badgeProgress", ["Badge progress", "How close am I to badges", "Which badges am I close to", "Upcoming badges"]),
-    ("activeQuests", ["What quests are active", "Show my quests", "Active quests", "Current quests"]),
-    ("questProgress", ["Quest progress", "How are my quests going", "Quest status"]),
-    ("readinessScore", ["What's my readiness", "Am I ready to work", "Readiness score", "How ready am I"]),
-    ("hrvStatus", ["What's my HRV", "Heart rate variability", "HRV status", "How's my HRV"]),
-    ("sleepScore", ["How did I sleep", "Sleep score", "Sleep quality", "How was my sleep", "Last night's sleep"]),
-    ("todayHealth", ["Today's health", "Health metrics", "How healthy am I today", "Vitals today"]),
-    ("dailySummary", ["Daily summary", "How was my day", "Today's summary", "Summarize today"]),
-    ("weeklySummary", ["Weekly summary", "How was my week", "This week's summary", "Week review"]),
-    ("contentPerformance", ["How's my content doing", "Content performance", "Content stats", "Post performance"]),
-    ("totalReach", ["What's my total reach", "How many people have I reached", "Reach metrics", "Content reach"]),
-    ("viralCount", ["How many viral posts", "Viral content", "Which posts went viral", "Viral count"]),
-    ("pipelineStatus", ["Content pipeline status", "What's in the pipeline", "Pipeline review"]),
-    ("creativeDimension", ["Creative dimension status", "How's my creative side", "Creative progress"]),
-]
-
-DIMENSIONS = ["cognitive", "creative", "physiological", "behavioral", "knowledge", "reflection"]
+LEVEL_QUERY_TYPES = (
+    ("levelStatus", ("What's my level", "What level am I", "Show my level", "Level status", "My current level")),
+    ("xpToday", ("How much XP today", "XP earned today", "Today's XP", "Show XP today", "What XP did I get")),
+    ("xpBreakdown", ("XP breakdown", "Show XP by dimension", "Break down my XP", "XP details")),
+    ("dimensionStatus", ("How's my cognitive dimension", "Show creative status", "What's my physiological progress", "Knowledge dimension status")),
+    ("streakStatus", ("What's my streak", "How long is my streak", "Current streak", "Show my streak", "Am I on a streak")),
+    ("allStreaks", ("Show all streaks", "What streaks do I have", "All my streaks", "Streak summary")),
+    ("badgesEarned", ("What badges have I earned", "Show my badges", "My achievements", "Badges unlocked", "Show achievements")),
+    ("badgeProgress", ("Badge progress", "How close am I to badges", "Which badges am I close to", "Upcoming badges")),
+    ("activeQuests", ("What quests are active", "Show my quests", "Active quests", "Current quests")),
+    ("questProgress", ("Quest progress", "How are my quests going", "Quest status")),
+    ("readinessScore", ("What's my readiness", "Am I ready to work", "Readiness score", "How ready am I")),
+    ("hrvStatus", ("What's my HRV", "Heart rate variability", "HRV status", "How's my HRV")),
+    ("sleepScore", ("How did I sleep", "Sleep score", "Sleep quality", "How was my sleep", "Last night's sleep")),
+    ("todayHealth", ("Today's health", "Health metrics", "How healthy am I today", "Vitals today")),
+    ("dailySummary", ("Daily summary", "How was my day", "Today's summary", "Summarize today")),
+    ("weeklySummary", ("Weekly summary", "How was my week", "This week's summary", "Week review")),
+    ("contentPerformance", ("How's my content doing", "Content performance", "Content stats", "Post performance")),
+    ("totalReach", ("What's my total reach", "How many people have I reached", "Reach metrics", "Content reach")),
+    ("viralCount", ("How many viral posts", "Viral content", "Which posts went viral", "Viral count")),
+    ("pipelineStatus", ("Content pipeline status", "What's in the pipeline", "Pipeline review")),
+    ("creativeDimension", ("Creative dimension status", "How's my creative side", "Creative progress")),
+)
+
+LEVEL_QUERY_CHOICES, LEVEL_QUERY_CUM_WEIGHTS = flatten_phrase_table(LEVEL_QUERY_TYPES)
+
+DIMENSIONS = ("cognitive", "creative", "physiological", "behavioral", "knowledge", "reflection")
+
+# Every (dimension, phrasing) pair for dimensionStatus queries, so one draw
+# picks both with the same uniform odds as drawing them in turn
+DIMENSION_STATUS_CHOICES = tuple(
+    (dimension, phrase)
+    for dimension in DIMENSIONS
+    for phrase in (
+        f"How's my {dimension} dimension",
+        f"Show {dimension} status",
+        f"What's my {dimension} progress",
+        f"{dimension.capitalize()} dimension status",
+    )
+)
 
 
-def generate_level_system_examples(n=2000):
-    """Generate Level System query examples."""
-    examples = []
+def _level_system_example(query_type, template):
+    """Build one Level System example, filling in a dimension where the query takes one."""
+    # Some queries can have dimension specified
+    params = {"query_type": query_type}
 
-    for _ in range(n):
-        query_type, templates = random.choice(LEVEL_QUERY_TYPES)
-        template = random.choice(templates)
-
-        # Some queries can have dimension specified
-        params = {"query_type": query_type}
-
-        if query_type == "dimensionStatus":
-            dimension = random.choice(DIMENSIONS)
-            params["dimension"] = dimension
-            # Modify template to include dimension
-            dimension_templates = [
-                f"How's my {dimension} dimension",
-                f"Show {dimension} status",
-                f"What's my {dimension} progress",
-                f"{dimension.capitalize()} dimension status",
-            ]
-            template = random.choice(dimension_templates)
+    if query_type == "dimensionStatus":
+        # Use a template that includes the dimension
+        dimension, template = random.choice(DIMENSION_STATUS_CHOICES)
+        params["dimension"] = dimension
 
-        output = make_function_call("query_level_system", params)
-        examples.append({"input": template, "output": output})
+    return {"input": template, "output": make_function_call("query_level_system", params)}
 
-    return examples
+
+def generate_level_system_examples(n=2000):
+    """Generate Level System query examples."""
+    return [
+        _level_system_example(query_type, template)
+        for query_type, template in random.choices(LEVEL_QUERY_CHOICES, cum_weights=LEVEL_QUERY_CUM_WEIGHTS, k=n)
+    ]
 
 
 # Deep Work templates
-DEEP_WORK_DURATIONS = [
-    (30, ["30 minutes", "half hour", "half an hour"]),
-    (45, ["45 minutes"]),
-    (60, ["1 hour", "an hour", "one hour", "60 minutes"]),
-    (90, ["90 minutes", "hour and a half", "1.5 hours"]),
-    (120, ["2 hours", "two hours", "couple hours"]),
-    (180, ["3 hours", "three hours"]),
-]
+DEEP_WORK_DURATIONS = (
+    (30, ("30 minutes", "half hour", "half an hour")),
+    (45, ("45 minutes",)),
+    (60, ("1 hour", "an hour", "one hour", "60 minutes")),
+    (90, ("90 minutes", "hour and a half", "1.5 hours")),
+    (120, ("2 hours", "two hours", "couple hours")),
+    (180, ("3 hours", "three hours")),
+)
+DEEP_WORK_DURATION_CHOICES, DEEP_WORK_DURATION_CUM_WEIGHTS = flatten_phrase_table(DEEP_WORK_DURATIONS)
+
+
+# Start deep work templates
+DEEP_WORK_START_TEMPLATES = (
+    "Start deep work",
+    "Begin focus mode",
+    "Let's do deep work",
+    "Enter focus mode",
+    "Start focused time",
+    "Begin concentration mode",
+    "Go into deep work",
+    "I want to focus",
+    "Time to focus",
+    "Focus time",
+    "Deep work mode",
+    "Heads down time",
+    "No distractions mode",
+)
+
+DEEP_WORK_START_WITH_DURATION_TEMPLATES = (
+    "Start deep work for {duration}",
+    "Focus for {duration}",
+    "Deep work {duration}",
+    "Let's focus for {duration}",
+    "Begin focus mode for {duration}",
+    "{duration} of deep work",
+    "I want to focus for {duration}",
+)
+
+DEEP_WORK_POMODORO_TEMPLATES = (
+    "Start pomodoro",
+    "Pomodoro mode",
+    "Begin pomodoro session",
+    "Let's do pomodoro",
+    "Start pomodoro deep work",
+)
+
+# Stop deep work templates
+DEEP_WORK_STOP_TEMPLATES = (
+    "Stop deep work",
+    "End focus mode",
+    "Done focusing",
+    "Stop focus mode",
+    "End deep work",
+    "Finish focus session",
+    "Exit focus mode",
+    "I'm done focusing",
+    "End concentration mode",
+    "Stop the timer",
+)
+
+# Extend deep work templates
+DEEP_WORK_EXTEND_TEMPLATES = (
+    "Extend deep work by {duration}",
+    "Add {duration} to focus time",
+    "Extend focus {duration}",
+    "Keep going for {duration} more",
+    "Add {duration} more",
+    "Continue for {duration}",
+    "{duration} more of deep work",
+)
+
+# Deep work calls that never vary, serialized once
+START_DEEP_WORK_CALL = make_function_call("start_deep_work", {})
+POMODORO_CALL = make_function_call("start_deep_work", {"duration_minutes": 25, "pomodoro_mode": True})
+STOP_DEEP_WORK_CALL = make_function_call("stop_deep_work", {})
+
+
+@functools.lru_cache(maxsize=None)
+def deep_work_phrases():
+    """Compiled deep work templates with placeholders, keyed by template kind."""
+    return {
+        "start_with_duration": tuple(map(compile_phrase, DEEP_WORK_START_WITH_DURATION_TEMPLATES)),
+        "extend": tuple(map(compile_phrase, DEEP_WORK_EXTEND_TEMPLATES)),
+    }
 
 
 def generate_deep_work_examples(n=1000):
     """Generate Deep Work session examples."""
     examples = []
-
-    # Start deep work templates
-    start_templates = [
-        "Start deep work",
-        "Begin focus mode",
-        "Let's do deep work",
-        "Enter focus mode",
-        "Start focused time",
-        "Begin concentration mode",
-        "Go into deep work",
-        "I want to focus",
-        "Time to focus",
-        "Focus time",
-        "Deep work mode",
-        "Heads down time",
-        "No distractions mode",
-    ]
-
-    start_with_duration_templates = [
-        "Start deep work for {duration}",
-        "Focus for {duration}",
-        "Deep work {duration}",
-        "Let's focus for {duration}",
-        "Begin focus mode for {duration}",
-        "{duration} of deep work",
-        "I want to focus for {duration}",
-    ]
-
-    start_pomodoro_templates = [
-        "Start pomodoro",
-        "Pomodoro mode",
-        "Begin pomodoro session",
-        "Let's do pomodoro",
-        "Start pomodoro deep work",
-    ]
-
-    # Stop deep work templates
-    stop_templates = [
-        "Stop deep work",
-        "End focus mode",
-        "Done focusing",
-        "Stop focus mode",
-        "End deep work",
-        "Finish focus session",
-        "Exit focus mode",
-        "I'm done focusing",
-        "End concentration mode",
-        "Stop the timer",
-    ]
-
-    # Extend deep work templates
-    extend_templates = [
-        "Extend deep work by {duration}",
-        "Add {duration} to focus time",
-        "Extend focus {duration}",
-        "Keep going for {duration} more",
-        "Add {duration} more",
-        "Continue for {duration}",
-        "{duration} more of deep work",
-    ]
+    phrases = deep_work_phrases()
 
     # Generate start examples (no duration)
-    for _ in range(n // 4):
-        template = random.choice(start_templates)
-        output = make_function_call("start_deep_work", {})
-        examples.append({"input": template, "output": output})
+    examples.extend([
+        {"input": template, "output": START_DEEP_WORK_CALL}
+        for template in random.choices(DEEP_WORK_START_TEMPLATES, k=n // 4)
+    ])
 
     # Generate start examples (with duration)
-    for _ in range(n // 3):
-        duration_mins, duration_texts = random.choice(DEEP_WORK_DURATIONS)
-        duration_text = random.choice(duration_texts)
-        template = random.choice(start_with_duration_templates).format(duration=duration_text)
-        output = make_function_call("start_deep_work", {"duration_minutes": duration_mins})
-        examples.append({"input": template, "output": output})
+    examples.extend([
+        {
+            "input": fill(duration=duration_text),
+            "output": make_function_call("start_deep_work", {"duration_minutes": duration_mins}),
+        }
+        for (duration_mins, duration_text), fill in zip(
+            random.choices(DEEP_WORK_DURATION_CHOICES, cum_weights=DEEP_WORK_DURATION_CUM_WEIGHTS, k=n // 3),
+            random.choices(phrases["start_with_duration"], k=n // 3),
+        )
+    ])
 
     # Generate pomodoro examples
-    for _ in range(n // 10):
-        template = random.choice(start_pomodoro_templates)
-        output = make_function_call("start_deep_work", {"duration_minutes": 25, "pomodoro_mode": True})
-        examples.append({"input": template, "output": output})
+    examples.extend([
+        {"input": template, "output": POMODORO_CALL}
+        for template in random.choices(DEEP_WORK_POMODORO_TEMPLATES, k=n // 10)
+    ])
 
     # Generate stop examples
-    for _ in range(n // 5):
-        template = random.choice(stop_templates)
-        output = make_function_call("stop_deep_work", {})
-        examples.append({"input": template, "output": output})
+    examples.extend([
+        {"input": template, "output": STOP_DEEP_WORK_CALL}
+        for template in random.choices(DEEP_WORK_STOP_TEMPLATES, k=n // 5)
+    ])
 
     # Generate extend examples
-    for _ in range(n // 6):
-        duration_mins, duration_texts = random.choice(DEEP_WORK_DURATIONS)
-        duration_text = random.choice(duration_texts)
-        template = random.choice(extend_templates).format(duration=duration_text)
-        output = make_function_call("extend_deep_work", {"additional_minutes": duration_mins})
-        examples.append({"input": template, "output": output})
+    examples.extend([
+        {
+            "input": fill(duration=duration_text),
+            "output": make_function_call("extend_deep_work", {"additional_minutes": duration_mins}),
+        }
+        for (duration_mins, duration_text), fill in zip(
+            random.choices(DEEP_WORK_DURATION_CHOICES, cum_weights=DEEP_WORK_DURATION_CUM_WEIGHTS, k=n // 6),
+            random.choices(phrases["extend"], k=n // 6),
+        )
+    ])
 
     return examples
 
 
 # Journal entry types
-JOURNAL_ENTRY_TYPES = [
-    ("gratitude", [
+JOURNAL_ENTRY_TYPES = (
+    ("gratitude", (
         "I'm grateful for {content}",
         "Grateful for {content}",
         "Thankful for {content}",
         "I appreciate {content}",
         "Gratitude: {content}",
-    ]),
-    ("mood", [
+    )),
+    ("mood", (
         "I'm feeling {feeling}",
         "Feeling {feeling}",
         "My mood is {feeling}",
         "I feel {feeling} today",
-    ]),
-    ("learning", [
+    )),
+    ("learning", (
         "I learned that {content}",
         "Today I learned {content}",
         "Learned: {content}",
         "TIL {content}",
         "I discovered that {content}",
-    ]),
-    ("reflection", [
+    )),
+    ("reflection", (
         "Reflecting on {content}",
         "I've been thinking about {content}",
         "Thought: {content}",
         "Reflection: {content}",
-    ]),
-    ("goal", [
+    )),
+    ("goal", (
         "My goal is to {content}",
         "I want to {content}",
         "Goal: {content}",
         "I'm aiming to {content}",
-    ]),
-    ("challenge", [
+    )),
+    ("challenge", (
         "I'm struggling with {content}",
         "Challenge: {content}",
         "My challenge is {content}",
         "I'm working through {content}",
-    ]),
-    ("celebration", [
+    )),
+    ("celebration", (
         "I achieved {content}",
         "Celebrating {content}",
         "Win: {content}",
         "I'm proud of {content}",
         "Victory: {content}",
-    ]),
-    ("intention", [
+    )),
+    ("intention", (
         "My intention today is {content}",
         "I intend to {content}",
         "Today I will {content}",
         "Setting intention: {content}",
-    ]),
-    ("freeform", [
+    )),
+    ("freeform", (
         "Journal: {content}",
         "Note to self: {content}",
         "Dear diary: {content}",
         "{content}",  # Sometimes just the content
-    ]),
-]
+    )),
+)
 
-GRATITUDE_CONTENT = [
+GRATITUDE_CONTENT = (
     "my team", "my health", "my family", "good sleep", "productive day",
     "the sunshine", "my morning coffee", "finishing the project", "supportive friends",
     "learning something new", "a good workout", "peaceful morning", "nice weather",
-]
+)
 
-FEELINGS = [
+FEELINGS = (
     "great", "amazing", "tired", "energized", "focused", "stressed", "calm",
     "happy", "productive", "creative", "motivated", "relaxed", "anxious",
     "excited", "peaceful", "content", "overwhelmed", "optimistic",
-]
+)
 
-LEARNING_CONTENT = [
+LEARNING_CONTENT = (
     "how to optimize database queries", "a new design pattern", "the importance of rest",
     "better communication skills", "time management techniques", "a new Swift feature",
     "how to handle errors gracefully", "the value of deep work", "how to prioritize",
-]
+)
 
-GENERAL_CONTENT = [
+GENERAL_CONTENT = (
     "my work-life balance", "improving my productivity", "building better habits",
     "being more present", "focusing on what matters", "taking care of my health",
     "learning new skills", "connecting with others", "simplifying my life",
-]
+)
 
 
-def generate_journal_examples(n=1000):
-    """Generate Journal command examples."""
-    examples = []
+JOURNAL_CHOICES, JOURNAL_CUM_WEIGHTS = flatten_phrase_table(JOURNAL_ENTRY_TYPES)
 
-    for _ in range(n):
-        entry_type, templates = random.choice(JOURNAL_ENTRY_TYPES)
-        template = random.choice(templates)
-
-        # Select appropriate content
-        if entry_type == "gratitude":
-            content = random.choice(GRATITUDE_CONTENT)
-        elif entry_type == "mood":
-            content = random.choice(FEELINGS)
-            template = template.replace("{content}", "{feeling}")
-        elif entry_type == "learning":
-            content = random.choice(LEARNING_CONTENT)
-        else:
-            content = random.choice(GENERAL_CONTENT)
+# Content pool per entry type; other types draw from GENERAL_CONTENT
+JOURNAL_CONTENT = {"gratitude": GRATITUDE_CONTENT, "mood": FEELINGS, "learning": LEARNING_CONTENT}
 
-        input_text = template.format(content=content, feeling=content)
 
-        # Handle mood differently - title should reflect feeling
-        if entry_type == "mood":
-            title = f"Feeling {content}"
-        else:
-            title = content.capitalize() if len(content) < 50 else content[:47] + "..."
+def journal_title(entry_type, content):
+    """Title for a journal entry of the given type and content."""
+    # Handle mood differently - title should reflect feeling
+    if entry_type == "mood":
+        return f"Feeling {content}"
+    return content.capitalize() if len(content) < 50 else content[:47] + "..."
 
-        params = {
-            "atom_type": "journalEntry",
-            "title": title,
-            "metadata": {"entryType": entry_type}
-        }
 
-        output = make_function_call("create_atom", params)
-        examples.append({"input": input_text, "output": output})
+# (content, title) pairs per entry type, titled once at load
+JOURNAL_TITLED_CONTENT = {
+    entry_type: tuple(
+        (content, journal_title(entry_type, content))
+        for content in JOURNAL_CONTENT.get(entry_type, GENERAL_CONTENT)
+    )
+    for entry_type, _ in JOURNAL_ENTRY_TYPES
+}
+
 
-    return examples
+@functools.lru_cache(maxsize=None)
+def journal_phrases():
+    """(entry type, compiled phrase) pairs matching JOURNAL_CHOICES.
+
+    Every journal template has one placeholder ({content}, or {feeling} for
+    mood), so each phrase takes the content as its only argument.
+    """
+    return tuple((entry_type, compile_phrase(template)) for entry_type, template in JOURNAL_CHOICES)
+
+
+def _journal_example(entry_type, fill, content, title):
+    """Build one Journal example from its entry type, compiled phrase, content and title."""
+    params = {
+        "atom_type": "journalEntry",
+        "title": title,
+        "metadata": {"entryType": entry_type}
+    }
+
+    return {"input": fill(content), "output": make_function_call("create_atom", params)}
+
+
+def generate_journal_examples(n=1000):
+    """Generate Journal command examples."""
+    entries = random.choices(journal_phrases(), cum_weights=JOURNAL_CUM_WEIGHTS, k=n)
+
+    # Select appropriate content, drawing each pool once for all entries that use it
+    counts = collections.Counter(entry_type for entry_type, _ in entries)
+    contents = {
+        entry_type: iter(random.choices(JOURNAL_TITLED_CONTENT[entry_type], k=count))
+        for entry_type, count in counts.items()
+    }
+
+    return [_journal_example(entry_type, fill, *next(contents[entry_type])) for entry_type, fill in entries]
 
 
 # Workout types
-WORKOUT_TYPES = [
-    ("run", ["run", "running", "went for a run", "jogged", "jogging"]),
-    ("walk", ["walk", "walked", "went for a walk", "walking"]),
-    ("swim", ["swim", "swimming", "swam", "went swimming"]),
-    ("cycle", ["bike", "cycling", "biked", "went cycling", "rode my bike"]),
-    ("strength", ["lifted weights", "strength training", "weight training", "gym workout", "lifted"]),
-    ("yoga", ["yoga", "did yoga", "yoga session"]),
-    ("hiit", ["HIIT", "hiit workout", "interval training", "tabata"]),
-]
-
-EXERCISES = [
+WORKOUT_TYPES = (
+    ("run", ("run", "running", "went for a run", "jogged", "jogging")),
+    ("walk", ("walk", "walked", "went for a walk", "walking")),
+    ("swim", ("swim", "swimming", "swam", "went swimming")),
+    ("cycle", ("bike", "cycling", "biked", "went cycling", "rode my bike")),
+    ("strength", ("lifted weights", "strength training", "weight training", "gym workout", "lifted")),
+    ("yoga", ("yoga", "did yoga", "yoga session")),
+    ("hiit", ("HIIT", "hiit workout", "interval training", "tabata")),
+)
+WORKOUT_CHOICES, WORKOUT_CUM_WEIGHTS = flatten_phrase_table(WORKOUT_TYPES)
+
+EXERCISES = (
     "push ups", "pull ups", "squats", "deadlifts", "bench press",
     "lunges", "planks", "burpees", "jumping jacks", "sit ups",
-]
+)
+
+
+# Workout logging templates
+WORKOUT_TEMPLATES = (
+    "Log {workout_type}",
+    "I did a {workout_type}",
+    "Just finished {workout_type}",
+    "Completed {workout_type} workout",
+    "{workout_type} done",
+)
+
+WORKOUT_WITH_DURATION_TEMPLATES = (
+    "Log {duration} minute {workout_type}",
+    "{workout_type} for {duration} minutes",
+    "Did {duration} minutes of {workout_type}",
+    "Just finished {duration} minute {workout_type}",
+)
+
+RUN_WITH_DISTANCE_TEMPLATES = (
+    "Ran {distance} km",
+    "Ran {distance} kilometers",
+    "{distance} km run",
+    "Went for a {distance} km run",
+)
+
+STRENGTH_TEMPLATES = (
+    "Did {sets} sets of {reps} {exercise}",
+    "{exercise} {sets} by {reps}",
+    "Completed {sets} sets of {exercise}",
+    "{reps} {exercise}",
+)
+
+
+@functools.lru_cache(maxsize=None)
+def workout_phrases():
+    """Compiled workout templates, keyed by template kind."""
+    return {
+        "workout": tuple(map(compile_phrase, WORKOUT_TEMPLATES)),
+        "workout_with_duration": tuple(map(compile_phrase, WORKOUT_WITH_DURATION_TEMPLATES)),
+        "run_with_distance": tuple(map(compile_phrase, RUN_WITH_DISTANCE_TEMPLATES)),
+        "strength": tuple(map(compile_phrase, STRENGTH_TEMPLATES)),
+    }
 
 
 def generate_workout_examples(n=500):
     """Generate workout logging examples."""
     examples = []
-
-    workout_templates = [
-        "Log {workout_type}",
-        "I did a {workout_type}",
-        "Just finished {workout_type}",
-        "Completed {workout_type} workout",
-        "{workout_type} done",
-    ]
-
-    workout_with_duration_templates = [
-        "Log {duration} minute {workout_type}",
-        "{workout_type} for {duration} minutes",
-        "Did {duration} minutes of {workout_type}",
-        "Just finished {duration} minute {workout_type}",
-    ]
-
-    run_with_distance_templates = [
-        "Ran {distance} km",
-        "Ran {distance} kilometers",
-        "{distance} km run",
-        "Went for a {distance} km run",
-    ]
-
-    strength_templates = [
-        "Did {sets} sets of {reps} {exercise}",
-        "{exercise} {sets} by {reps}",
-        "Completed {sets} sets of {exercise}",
-        "{reps} {exercise}",
-    ]
+    phrases = workout_phrases()
 
     # Basic workout logs
-    for _ in range(n // 3):
-        workout_type, workout_texts = random.choice(WORKOUT_TYPES)
-        workout_text = random.choice(workout_texts)
-        template = random.choice(workout_templates).format(workout_type=workout_text)
-        output = make_function_call("log_workout", {"workout_type": workout_type})
-        examples.append({"input": template, "output": output})
+    examples.extend([
+        {
+            "input": fill(workout_type=workout_text),
+            "output": make_function_call("log_workout", {"workout_type": workout_type}),
+        }
+        for (workout_type, workout_text), fill in zip(
+            random.choices(WORKOUT_CHOICES, cum_weights=WORKOUT_CUM_WEIGHTS, k=n // 3),
+            random.choices(phrases["workout"], k=n // 3),
+        )
+    ])
 
     # Workout with duration
-    for _ in range(n // 3):
-        workout_type, workout_texts = random.choice(WORKOUT_TYPES)
-        workout_text = random.choice(workout_texts)
-        duration = random.choice([15, 20, 30, 45, 60, 90])
-        template = random.choice(workout_with_duration_templates).format(
-            workout_type=workout_text, duration=duration
+    examples.extend([
+        {
+            "input": fill(workout_type=workout_text, duration=duration),
+            "output": make_function_call("log_workout", {
+                "workout_type": workout_type,
+                "duration_minutes": duration
+            }),
+        }
+        for (workout_type, workout_text), duration, fill in zip(
+            random.choices(WORKOUT_CHOICES, cum_weights=WORKOUT_CUM_WEIGHTS, k=n // 3),
+            random.choices([15, 20, 30, 45, 60, 90], k=n // 3),
+            random.choices(phrases["workout_with_duration"], k=n // 3),
         )
-        output = make_function_call("log_workout", {
-            "workout_type": workout_type,
-            "duration_minutes": duration
-        })
-        examples.append({"input": template, "output": output})
+    ])
 
     # Running with distance
-    for _ in range(n // 6):
-        distance = random.choice([3, 5, 7, 10, 15, 21])
-        template = random.choice(run_with_distance_templates).format(distance=distance)
-        output = make_function_call("log_workout", {
-            "workout_type": "run",
-            "distance_km": distance
-        })
-        examples.append({"input": template, "output": output})
+    examples.extend([
+        {
+            "input": fill(distance=distance),
+            "output": make_function_call("log_workout", {
+                "workout_type": "run",
+                "distance_km": distance
+            }),
+        }
+        for distance, fill in zip(
+            random.choices([3, 5, 7, 10, 15, 21], k=n // 6),
+            random.choices(phrases["run_with_distance"], k=n // 6),
+        )
+    ])
 
     # Strength with sets/reps
-    for _ in range(n // 6):
-        exercise = random.choice(EXERCISES)
-        sets = random.choice([3, 4, 5])
-        reps = random.choice([8, 10, 12, 15, 20])
-        template = random.choice(strength_templates).format(
-            exercise=exercise, sets=sets, reps=reps
+    examples.extend([
+        {
+            "input": fill(exercise=exercise, sets=sets, reps=reps),
+            "output": make_function_call("log_workout", {
+                "workout_type": "strength",
+                "exercise": exercise,
+                "sets": sets,
+                "reps": reps
+            }),
+        }
+        for exercise, sets, reps, fill in zip(
+            random.choices(EXERCISES, k=n // 6),
+            random.choices([3, 4, 5], k=n // 6),
+            random.choices([8, 10, 12, 15, 20], k=n // 6),
+            random.choices(phrases["strength"], k=n // 6),
         )
-        output = make_function_call("log_workout", {
-            "workout_type": "strength",
-            "exercise": exercise,
-            "sets": sets,
-            "reps": reps
-        })
-        examples.append({"input": template, "output": output})
+    ])
 
     return examples
 
 
 # Navigation destinations
-NAVIGATION_DESTINATIONS = [
-    ("home", ["go home", "open home", "show home", "home screen"]),
-    ("today", ["go to today", "open today", "show today", "today view"]),
-    ("projects", ["go to projects", "open projects", "show projects", "my projects"]),
-    ("ideas", ["go to ideas", "open ideas", "show ideas", "idea list"]),
-    ("tasks", ["go to tasks", "open tasks", "show tasks", "task list", "my tasks"]),
-    ("schedule", ["go to schedule", "open schedule", "show schedule", "my calendar", "calendar"]),
-    ("research", ["go to research", "open research", "show research"]),
-    ("focus", ["go to focus", "open focus mode", "focus screen"]),
-    ("settings", ["go to settings", "open settings", "settings"]),
-    ("sanctuary", ["go to sanctuary", "open sanctuary", "sanctuary view", "show sanctuary"]),
-    ("dashboard", ["go to dashboard", "open dashboard", "show dashboard", "main dashboard"]),
+NAVIGATION_DESTINATIONS = (
+    ("home", ("go home", "open home", "show home", "home screen")),
+    ("today", ("go to today", "open today", "show today", "today view")),
+    ("projects", ("go to projects", "open projects", "show projects", "my projects")),
+    ("ideas", ("go to ideas", "open ideas", "show ideas", "idea list")),
+    ("tasks", ("go to tasks", "open tasks", "show tasks", "task list", "my tasks")),
+    ("schedule", ("go to schedule", "open schedule", "show schedule", "my calendar", "calendar")),
+    ("research", ("go to research", "open research", "show research")),
+    ("focus", ("go to focus", "open focus mode", "focus screen")),
+    ("settings", ("go to settings", "open settings", "settings")),
+    ("sanctuary", ("go to sanctuary", "open sanctuary", "sanctuary view", "show sanctuary")),
+    ("dashboard", ("go to dashboard", "open dashboard", "show dashboard", "main dashboard")),
     # NEW: Modern CosmoOS navigation destinations
-    ("plannerum", ["go to plannerum", "open plannerum", "show plannerum", "planner", "plan", "planning", "open planner", "go to planner"]),
-    ("thinkspace", ["go to thinkspace", "open thinkspace", "show thinkspace", "canvas", "think", "open canvas", "go to canvas", "thinking space"]),
-    ("inbox", ["go to inbox", "open inbox", "show inbox", "my inbox", "inbox view"]),
-    ("notes", ["go to notes", "open notes", "show notes", "my notes", "notes view"]),
-]
+    ("plannerum", ("go to plannerum", "open plannerum", "show plannerum", "planner", "plan", "planning", "open planner", "go to planner")),
+    ("thinkspace", ("go to thinkspace", "open thinkspace", "show thinkspace", "canvas", "think", "open canvas", "go to canvas", "thinking space")),
+    ("inbox", ("go to inbox", "open inbox", "show inbox", "my inbox", "inbox view")),
+    ("notes", ("go to notes", "open notes", "show notes", "my notes", "notes view")),
+)
+
+
+NAVIGATION_CHOICES, NAVIGATION_CUM_WEIGHTS = flatten_phrase_table(NAVIGATION_DESTINATIONS)
 
 
 def generate_navigation_examples(n=600):
     """Generate navigation examples."""
-    examples = []
+    # The call depends only on the destination, so build each one once
+    calls = {
+        destination: make_function_call("navigate", {"destination": destination})
+        for destination, _ in NAVIGATION_DESTINATIONS
+    }
+    return [
+        {"input": template, "output": calls[destination]}
+        for destination, template in random.choices(NAVIGATION_CHOICES, cum_weights=NAVIGATION_CUM_WEIGHTS, k=n)
+    ]
 
-    for _ in range(n):
-        destination, templates = random.choice(NAVIGATION_DESTINATIONS)
-        template = random.choice(templates)
-        output = make_function_call("navigate", {"destination": destination})
-        examples.append({"input": template, "output": output})
 
-    return examples
+# The developer turn is identical in every conversation, so one dict is shared
+DEVELOPER_MESSAGE = {"role": "developer", "content": FUNCTIONGEMMA_SYSTEM_PROMPT}
 
 
 def format_for_mlx_lm(examples):
@@ -1381,14 +1789,21 @@ def format_for_mlx_lm(examples):
     Uses FunctionGemma's expected roles: developer, user, model
     """
     formatted = []
+    # Cached renders share output dicts, so convert each distinct dict once;
+    # entries keep their dict alive so its id cannot be reused meanwhile
+    calls = {}
 
     for ex in examples:
         # For FunctionGemma, output is already formatted as the function call string
-        output = ex["output"] if isinstance(ex["output"], str) else make_function_call_from_dict(ex["output"])
+        output = ex["output"]
+        if not isinstance(output, str):
+            if id(output) not in calls:
+                calls[id(output)] = output, make_function_call_from_dict(output)
+            _, output = calls[id(output)]
 
         formatted.append({
             "messages": [
-                {"role": "developer", "content": FUNCTIONGEMMA_SYSTEM_PROMPT},
+                DEVELOPER_MESSAGE,
                 {"role": "user", "content": ex["input"]},
                 {"role": "model", "content": output}
             ]
@@ -1397,170 +1812,245 @@ def format_for_mlx_lm(examples):
     return formatted
 
 
+def _create_call(output_dict):
+    atom_type = output_dict.get("type", "idea")
+    params = {"atom_type": atom_type, "title": output_dict.get("title", "Untitled")}
+    if "body" in output_dict:
+        params["body"] = output_dict["body"]
+    if "metadata" in output_dict:
+        params["metadata"] = output_dict["metadata"]
+    if "links" in output_dict:
+        params["links"] = output_dict["links"]
+    return make_function_call("create_atom", params)
+
+
+def _update_call(output_dict):
+    params = {"target": output_dict.get("target", "context")}
+    if "title" in output_dict:
+        params["title"] = output_dict["title"]
+    if "body" in output_dict:
+        params["body"] = output_dict["body"]
+    if "metadata" in output_dict:
+        params["metadata"] = output_dict["metadata"]
+    if "links" in output_dict:
+        params["links"] = output_dict["links"]
+    return make_function_call("update_atom", params)
+
+
+def _delete_call(output_dict):
+    return make_function_call("delete_atom", {"target": output_dict.get("target", "context")})
+
+
+def _search_call(output_dict):
+    params = {}
+    if "query" in output_dict:
+        params["query"] = output_dict["query"]
+    if "type" in output_dict:
+        params["types"] = [output_dict["type"]]
+    if "filter" in output_dict:
+        # Flatten filters into params
+        for k, v in output_dict["filter"].items():
+            params[k] = v
+    if "mode" in output_dict:
+        params["mode"] = output_dict["mode"]
+    if "target" in output_dict:
+        params["target"] = output_dict["target"]
+    return make_function_call("search_atoms", params)
+
+
+def _batch_call(output_dict):
+    items = []
+    for item in output_dict.get("items", []):
+        item_dict = {
+            "atom_type": item.get("type", "task"),
+            "title": item.get("title", "Untitled")
+        }
+        if "links" in item:
+            item_dict["links"] = item["links"]
+        items.append(item_dict)
+    return make_function_call("batch_create", {"items": items})
+
+
+def _navigate_call(output_dict):
+    return make_function_call("navigate", {"destination": output_dict.get("destination", "home")})
+
+
+def _fallback_call(output_dict):
+    return make_function_call("create_atom", {"atom_type": "idea", "title": "Unknown"})
+
+
+# Old-style dict converter for each action; unknown actions use _fallback_call
+CALL_FROM_DICT_BUILDERS = {
+    "create": _create_call,
+    "update": _update_call,
+    "delete": _delete_call,
+    "search": _search_call,
+    "batch": _batch_call,
+    "navigate": _navigate_call,
+}
+
+
 def make_function_call_from_dict(output_dict):
     """Convert old-style dict output to FunctionGemma format (for backwards compat)."""
-    action = output_dict.get("action")
-
-    if action == "create":
-        atom_type = output_dict.get("type", "idea")
-        params = {"atom_type": atom_type, "title": output_dict.get("title", "Untitled")}
-        if "body" in output_dict:
-            params["body"] = output_dict["body"]
-        if "metadata" in output_dict:
-            params["metadata"] = output_dict["metadata"]
-        if "links" in output_dict:
-            params["links"] = output_dict["links"]
-        return make_function_call("create_atom", params)
-
-    elif action == "update":
-        params = {"target": output_dict.get("target", "context")}
-        if "title" in output_dict:
-            params["title"] = output_dict["title"]
-        if "body" in output_dict:
-            params["body"] = output_dict["body"]
-        if "metadata" in output_dict:
-            params["metadata"] = output_dict["metadata"]
-        if "links" in output_dict:
-            params["links"] = output_dict["links"]
-        return make_function_call("update_atom", params)
-
-    elif action == "delete":
-        return make_function_call("delete_atom", {"target": output_dict.get("target", "context")})
-
-    elif action == "search":
-        params = {}
-        if "query" in output_dict:
-            params["query"] = output_dict["query"]
-        if "type" in output_dict:
-            params["types"] = [output_dict["type"]]
-        if "filter" in output_dict:
-            # Flatten filters into params
-            for k, v in output_dict["filter"].items():
-                params[k] = v
-        if "mode" in output_dict:
-            params["mode"] = output_dict["mode"]
-        if "target" in output_dict:
-            params["target"] = output_dict["target"]
-        return make_function_call("search_atoms", params)
-
-    elif action == "batch":
-        items = []
-        for item in output_dict.get("items", []):
-            item_dict = {
-                "atom_type": item.get("type", "task"),
-                "title": item.get("title", "Untitled")
-            }
-            if "links" in item:
-                item_dict["links"] = item["links"]
-            items.append(item_dict)
-        return make_function_call("batch_create", {"items": items})
-
-    elif action == "navigate":
-        return make_function_call("navigate", {"destination": output_dict.get("destination", "home")})
+    builder = CALL_FROM_DICT_BUILDERS.get(output_dict.get("action"), _fallback_call)
+    return builder(output_dict)
 
-    else:
-        # Fallback
-        return make_function_call("create_atom", {"atom_type": "idea", "title": "Unknown"})
+
+# A whole well-formed "<start_function_call>call:NAME{...}<end_function_call>" string
+FUNCTION_CALL_PATTERN = re.compile(r"<start_function_call>call:(\w+)\{.*<end_function_call>", re.DOTALL)
+
+# Function name anywhere in a call string
+FUNCTION_NAME_PATTERN = re.compile(r"call:(\w+)\{")
+
+# Functions the model may call
+VALID_FUNCTIONS = frozenset({
+    "create_atom", "update_atom", "delete_atom", "search_atoms",
+    "batch_create", "navigate", "query_level_system",
+    "start_deep_work", "stop_deep_work", "extend_deep_work",
+    "log_workout", "trigger_correlation_analysis"
+})
 
 
 def validate_examples(examples):
     """Validate all examples have valid structure."""
-    valid_functions = {
-        "create_atom", "update_atom", "delete_atom", "search_atoms",
-        "batch_create", "navigate", "query_level_system",
-        "start_deep_work", "stop_deep_work", "extend_deep_work",
-        "log_workout", "trigger_correlation_analysis"
-    }
-
     issues = []
     for i, ex in enumerate(examples):
         output = ex.get("output", "")
 
         # For new FunctionGemma format (string)
         if isinstance(output, str):
-            # Check it has proper format
-            if not output.startswith("<start_function_call>"):
-                issues.append(f"Example {i}: Missing <start_function_call> prefix")
-            elif not output.endswith("<end_function_call>"):
-                issues.append(f"Example {i}: Missing <end_function_call> suffix")
-            else:
-                # Extract function name
-                import re
-                match = re.search(r"call:(\w+)\{", output)
-                if match:
-                    func_name = match.group(1)
-                    if func_name not in valid_functions:
-                        issues.append(f"Example {i}: Unknown function '{func_name}'")
+            # One match checks the prefix, suffix and function name together
+            match = FUNCTION_CALL_PATTERN.fullmatch(output)
+            if match is None:
+                # Check each part separately to report what is wrong
+                if not output.startswith("<start_function_call>"):
+                    issues.append(f"Example {i}: Missing <start_function_call> prefix")
+                elif not output.endswith("<end_function_call>"):
+                    issues.append(f"Example {i}: Missing <end_function_call> suffix")
                 else:
-                    issues.append(f"Example {i}: Could not parse function name")
+                    # Extract function name
+                    match = FUNCTION_NAME_PATTERN.search(output)
+                    if not match:
+                        issues.append(f"Example {i}: Could not parse function name")
+            if match:
+                func_name = match.group(1)
+                if func_name not in VALID_FUNCTIONS:
+                    issues.append(f"Example {i}: Unknown function '{func_name}'")
         # For old dict format (backwards compat)
         elif isinstance(output, dict):
+            # Valid actions are exactly those make_function_call_from_dict converts
             action = output.get("action")
-            valid_actions = {"create", "update", "delete", "search", "batch", "navigate"}
-            if action and action not in valid_actions:
+            if action and action not in CALL_FROM_DICT_BUILDERS:
                 issues.append(f"Example {i}: Invalid action '{action}'")
 
     return issues
 
 
-def main():
-    print("🎯 CosmoOS FunctionGemma Training Data Generator v3")
-    print("=" * 60)
-    print("Generating 15,000+ examples for FunctionGemma 270M fine-tuning")
-    print("Output format: <start_function_call>call:FUNC{params}<end_function_call>")
+def encode_jsonl(records):
+    """Serialize records as finished JSONL lines."""
+    return [_dumps(record) + b"\n" for record in records]
 
-    # Generate all categories
-    print("\n📝 Generating training examples...")
 
-    simple_examples = generate_simple_creation_examples(4000)
-    print(f"  ✓ Simple entity creation: {len(simple_examples)} examples")
+def write_jsonl(path, lines):
+    """Write encoded JSONL lines with a single join and write."""
+    # Unlink first: finetune_functiongemma.py may have hardlinked this name
+    # to a *_original.jsonl file, which must not be truncated in place.
+    path.unlink(missing_ok=True)
+    path.write_bytes(b"".join(lines))
 
-    project_examples = generate_project_specific_examples(2500)
-    print(f"  ✓ Project-specific creation: {len(project_examples)} examples")
 
-    timed_examples = generate_timed_creation_examples(2000)
-    print(f"  ✓ Timed entity creation: {len(timed_examples)} examples")
+# Largest slice of a shardable category handed to a single worker
+GENERATOR_CHUNK_SIZE = 500
 
-    modification_examples = generate_modification_examples(1500)
-    print(f"  ✓ Entity modification: {len(modification_examples)} examples")
+# Leading examples per category kept for examples_raw.json
+RAW_SAMPLE_SIZE = 50
 
-    level_system_examples = generate_level_system_examples(2000)
-    print(f"  ✓ Level System queries: {len(level_system_examples)} examples")
 
-    deep_work_examples = generate_deep_work_examples(1000)
-    print(f"  ✓ Deep Work commands: {len(deep_work_examples)} examples")
+def run_generator(generator, n, seed):
+    """Run one category generator with its own seed (multiprocessing worker).
 
-    journal_examples = generate_journal_examples(1000)
-    print(f"  ✓ Journal entries: {len(journal_examples)} examples")
+    Validation, formatting and serialization happen in the worker, so only
+    the example count, validation issues, a leading sample for inspection
+    and the MLX-LM JSONL lines are sent back, not every example dict.
+    """
+    random.seed(seed)
+    examples = generator(n)
+    lines = encode_jsonl(format_for_mlx_lm(examples))
+    return len(examples), validate_examples(examples), examples[:RAW_SAMPLE_SIZE], lines
 
-    workout_examples = generate_workout_examples(500)
-    print(f"  ✓ Workout logging: {len(workout_examples)} examples")
 
-    navigation_examples = generate_navigation_examples(600)
-    print(f"  ✓ Navigation: {len(navigation_examples)} examples")
+def split_count(n, chunk_size=GENERATOR_CHUNK_SIZE):
+    """Split n into near-equal chunk sizes of at most chunk_size."""
+    chunks = -(-n // chunk_size)
+    base, extra = divmod(n, chunks)
+    return [base + 1] * extra + [base] * (chunks - extra)
 
-    batch_examples = generate_batch_examples(500)
-    print(f"  ✓ Multi-entity / brain dump: {len(batch_examples)} examples")
 
-    # Combine all examples
-    all_examples = (
-        simple_examples +
-        project_examples +
-        timed_examples +
-        modification_examples +
-        level_system_examples +
-        deep_work_examples +
-        journal_examples +
-        workout_examples +
-        navigation_examples +
-        batch_examples
-    )
+def main():
+    print("🎯 CosmoOS FunctionGemma Training Data Generator v3")
+    print("=" * 60)
+    print("Generating 15,000+ examples for FunctionGemma 270M fine-tuning")
+    print("Output format: <start_function_call>call:FUNC{params}<end_function_call>")
 
-    print(f"\n📊 Total examples: {len(all_examples)}")
+    # Generate all categories
+    print("\n📝 Generating training examples...")
+
+    # Categories are independent, so each runs in its own worker process.
+    # Modification and batch return exactly n examples, so they are also split
+    # into chunks that run on separate workers. The creation categories
+    # deduplicate their inputs, which only holds across one whole run, so each
+    # is a single job; they are the ones whose count is checked against n.
+    categories = [
+        ("Simple entity creation", generate_simple_creation_examples, 4000, False, True),
+        ("Project-specific creation", generate_project_specific_examples, 2500, False, True),
+        ("Timed entity creation", generate_timed_creation_examples, 2000, False, True),
+        ("Entity modification", generate_modification_examples, 1500, True, False),
+        ("Level System queries", generate_level_system_examples, 2000, False, False),
+        ("Deep Work commands", generate_deep_work_examples, 1000, False, False),
+        ("Journal entries", generate_journal_examples, 1000, False, False),
+        ("Workout logging", generate_workout_examples, 500, False, False),
+        ("Navigation", generate_navigation_examples, 600, False, False),
+        ("Multi-entity / brain dump", generate_batch_examples, 500, True, False),
+    ]
+    # Per-chunk seeds come from the parent RNG so a seeded run is reproducible
+    scheduled = []
+    for index, (_, generator, n, shardable, _) in enumerate(categories):
+        for size in (split_count(n) if shardable else [n]):
+            scheduled.append((index, (generator, size, random.getrandbits(32))))
+    # Hand out the largest jobs first so big unsharded categories don't start
+    # last; the sort is stable, so each category's chunks keep their order
+    scheduled.sort(key=lambda item: item[1][1], reverse=True)
+    owners = [index for index, _ in scheduled]
+    jobs = [job for _, job in scheduled]
+    with multiprocessing.Pool(min(len(jobs), os.cpu_count() or 1)) as pool:
+        results = pool.starmap(run_generator, jobs, chunksize=1)
+
+    # Chunks of a category arrive in order, so its samples come from the front
+    category_counts = [0 for _ in categories]
+    category_samples = [[] for _ in categories]
+    category_lines = [[] for _ in categories]
+    issues = []
+    for index, (count, chunk_issues, sample, lines) in zip(owners, results):
+        label = categories[index][0]
+        category_counts[index] += count
+        category_samples[index].extend(sample[:RAW_SAMPLE_SIZE - len(category_samples[index])])
+        category_lines[index].extend(lines)
+        issues.extend(f"{label}: {issue}" for issue in chunk_issues)
+
+    all_lines = []
+    for (label, _, n, _, deduplicated), count, lines in zip(categories, category_counts, category_lines):
+        if deduplicated and count < n:
+            # Deduplication stalled before finding n distinct inputs
+            print(f"  ⚠️  {label}: {count} examples ({n - count} short of {n})")
+        else:
+            print(f"  ✓ {label}: {count} examples")
+        all_lines.extend(lines)
+    simple_examples, project_examples = category_samples[0], category_samples[1]
 
-    # Validate
+    print(f"\n📊 Total examples: {len(all_lines)}")
+
+    # Validate (the workers checked their own examples)
     print("\n🔍 Validating examples...")
-    issues = validate_examples(all_examples)
     if issues:
         print(f"  ⚠️  Found {len(issues)} validation issues:")
         for issue in issues[:10]:  # Show first 10
@@ -1570,71 +2060,68 @@ def main():
     else:
         print("  ✓ All examples valid!")
 
-    # Shuffle
-    random.shuffle(all_examples)
+    # Shuffle (the workers already formatted each example as a JSONL line)
+    random.shuffle(all_lines)
 
     # Split into train/validation
-    split_idx = int(len(all_examples) * 0.9)
-    train_examples = all_examples[:split_idx]
-    valid_examples = all_examples[split_idx:]
-
-    print(f"\n📁 Split: {len(train_examples)} train, {len(valid_examples)} validation")
+    split_idx = int(len(all_lines) * 0.9)
+    train_lines = all_lines[:split_idx]
+    valid_lines = all_lines[split_idx:]
 
-    # Format for MLX-LM
-    train_formatted = format_for_mlx_lm(train_examples)
-    valid_formatted = format_for_mlx_lm(valid_examples)
+    print(f"\n📁 Split: {len(train_lines)} train, {len(valid_lines)} validation")
 
     # Write files
     print("\n💾 Writing files...")
 
     train_path = OUTPUT_DIR / "train.jsonl"
-    with open(train_path, "w") as f:
-        for ex in train_formatted:
-            f.write(json.dumps(ex) + "\n")
+    write_jsonl(train_path, train_lines)
     print(f"  ✓ {train_path}")
 
     valid_path = OUTPUT_DIR / "valid.jsonl"
-    with open(valid_path, "w") as f:
-        for ex in valid_formatted:
-            f.write(json.dumps(ex) + "\n")
+    write_jsonl(valid_path, valid_lines)
     print(f"  ✓ {valid_path}")
 
     # Write raw examples for inspection (include project-specific examples prominently)
     raw_path = OUTPUT_DIR / "examples_raw.json"
     # Get first 50 simple + first 50 project-specific for good coverage
-    sample_examples = simple_examples[:50] + project_examples[:50]
+    sample_examples = simple_examples + project_examples
     random.shuffle(sample_examples)
     with open(raw_path, "w") as f:
         json.dump(sample_examples, f, indent=2)
     print(f"  ✓ {raw_path} (100 samples for inspection)")
 
-    print("\n✅ Training data generation complete!")
-    print(f"\n📌 FunctionGemma output format:")
-    print(f"   <start_function_call>call:FUNC_NAME{{params}}<end_function_call>")
-    print(f"\n📌 Key patterns now supported:")
-    print(f"   • 'Idea for Michael about marketing' → create_atom with project link")
-    print(f"   • 'What's my level?' → query_level_system{{query_type:levelStatus}}")
-    print(f"   • 'Start deep work for 2 hours' → start_deep_work{{duration_minutes:120}}")
-    print(f"   • 'I'm grateful for my team' → create_atom journalEntry with gratitude type")
-    print(f"   • 'Log 5km run' → log_workout{{workout_type:run,distance_km:5}}")
-    print(f"\n📌 Next steps:")
-    print(f"   1. Review samples in {OUTPUT_DIR}/examples_raw.json")
-    print(f"   2. Download FunctionGemma 270M:")
-    print(f"      huggingface-cli download google/functiongemma-270m-it")
-    print(f"   3. Convert to MLX format:")
-    print(f"      python -m mlx_lm.convert \\")
-    print(f"        --hf-path google/functiongemma-270m-it \\")
-    print(f"        --mlx-path ./models/functiongemma-270m-mlx")
-    print(f"   4. Run fine-tuning with MLX-LM LoRA:")
-    print(f"      python -m mlx_lm.lora \\")
-    print(f"        --model ./models/functiongemma-270m-mlx \\")
-    print(f"        --data {OUTPUT_DIR} \\")
-    print(f"        --train \\")
-    print(f"        --batch-size 4 \\")
-    print(f"        --lora-rank 16 \\")
-    print(f"        --lora-alpha 32 \\")
-    print(f"        --epochs 3 \\")
-    print(f"        --output ./models/functiongemma-270m-cosmo-v1")
+    # Emit the closing summary as one write instead of a print per line
+    summary = "\n".join([
+        "\n✅ Training data generation complete!",
+        f"\n📌 FunctionGemma output format:",
+        f"   <start_function_call>call:FUNC_NAME{{params}}<end_function_call>",
+        f"\n📌 Key patterns now supported:",
+        f"   • 'Idea for Michael about marketing' → create_atom with project link",
+        f"   • 'What's my level?' → query_level_system{{query_type:levelStatus}}",
+        f"   • 'Start deep work for 2 hours' → start_deep_work{{duration_minutes:120}}",
+        f"   • 'I'm grateful for my team' → create_atom journalEntry with gratitude type",
+        f"   • 'Log 5km run' → log_workout{{workout_type:run,distance_km:5}}",
+        f"\n📌 Next steps:",
+        f"   1. Review samples in {OUTPUT_DIR}/examples_raw.json",
+        f"   2. Download FunctionGemma 270M:",
+        f"      huggingface-cli download google/functiongemma-270m-it",
+        f"   3. Convert to MLX format:",
+        f"      python -m mlx_lm.convert \\",
+        f"        --hf-path google/functiongemma-270m-it \\",
+        f"        --mlx-path ./models/functiongemma-270m-mlx",
+        f"   4. Run fine-tuning with MLX-LM LoRA:",
+        f"      python -m mlx_lm.lora \\",
+        f"        --model ./models/functiongemma-270m-mlx \\",
+        f"        --data {OUTPUT_DIR} \\",
+        f"        --train \\",
+        f"        --batch-size 4 \\",
+        f"        --lora-rank 16 \\",
+        f"        --lora-alpha 32 \\",
+        f"        --epochs 3 \\",
+        f"        --output ./models/functiongemma-270m-cosmo-v1",
+    ])
+    sys.stdout.write(summary + "\n")
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":